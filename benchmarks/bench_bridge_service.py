@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+🔌 BRIDGE SERVICE LOAD GENERATOR
+Starts bridge_service.py on a temporary Unix socket (or localhost TCP),
+drives it with persistent pipelining clients and reports requests/s and
+latency percentiles per operation
+
+Usage: python benchmarks/bench_bridge_service.py [--clients N] [--concurrency N]
+                                                 [--requests N] [--restore-ratio R] [--tcp] [--no-fsync]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SERVICE = REPO_ROOT / 'src' / 'quantum-enhancement' / 'bridge_service.py'
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'mcp-integration'))
+sys.path.insert(0, str(SERVICE.parent))
+
+# Client side only: keep the bridge module from configuring file logging on import
+logging.getLogger().addHandler(logging.NullHandler())
+
+SESSION = {'key_insights': ['timeline', 'evidence'], 'conversation': [{'role': 'user', 'content': 'x' * 200}]}
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _wait_for_service(args, process: subprocess.Popen, socket_path: str):
+    from bridge_service import BridgeClient
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"bridge service exited with {process.returncode}")
+        try:
+            client = BridgeClient(None if args.tcp else socket_path, port=args.port)
+            await client.connect()
+            await client.status()
+            await client.close()
+            return
+        except (ConnectionError, FileNotFoundError, OSError):
+            await asyncio.sleep(0.1)
+    raise RuntimeError('bridge service did not come up')
+
+
+async def run_load(args, socket_path: str) -> Dict[str, Any]:
+    from bridge_service import BridgeClient
+    clients = [await BridgeClient(None if args.tcp else socket_path, port=args.port).connect()
+               for _ in range(args.clients)]
+
+    # Seed sessions so restores have something to hit
+    seeded = await asyncio.gather(*(
+        clients[i % len(clients)].preserve(SESSION, {'name': 'seed'}, {'determination': 1.0})
+        for i in range(max(1, args.clients * args.concurrency))
+    ))
+    session_ids = list(seeded)
+
+    latencies: Dict[str, List[float]] = {'preserve': [], 'restore': []}
+    remaining = iter(range(args.requests))
+
+    async def worker(client: BridgeClient):
+        for _ in remaining:
+            started = time.perf_counter()
+            if random.random() < args.restore_ratio:
+                await client.restore(random.choice(session_ids))
+                latencies['restore'].append(time.perf_counter() - started)
+            else:
+                session_ids.append(await client.preserve(SESSION, {'name': 'bench'}, {'determination': 1.0}))
+                latencies['preserve'].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(client) for client in clients for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    status = await clients[0].status()
+    for client in clients:
+        await client.close()
+    return {'elapsed': elapsed, 'latencies': latencies, 'service': status['service']}
+
+
+def report(args, result: Dict):
+    total = sum(len(samples) for samples in result['latencies'].values())
+    transport = 'tcp' if args.tcp else 'unix'
+    print(f"{transport} socket, {args.clients} clients x {args.concurrency} in flight, "
+          f"{total} requests in {result['elapsed']:.2f}s -> {total / result['elapsed']:.0f} req/s\n")
+    print(f"{'op':<10}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for op, samples in result['latencies'].items():
+        if not samples:
+            continue
+        print(f"{op:<10}{len(samples):>8}"
+              f"{percentile(samples, 0.50) * 1000:>10.2f}{percentile(samples, 0.95) * 1000:>10.2f}"
+              f"{percentile(samples, 0.99) * 1000:>10.2f}{max(samples) * 1000:>10.2f}")
+    service = result['service']
+    print(f"\ngroup commits: {service['batches']} (avg {service['avg_batch_size']} preserves/batch), "
+          f"restore cache: {service['cache_hits']} hits / {service['cache_misses']} misses")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=8, help='persistent connections')
+    parser.add_argument('--concurrency', type=int, default=8, help='pipelined requests per connection')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--restore-ratio', type=float, default=0.5)
+    parser.add_argument('--batch-max', type=int, default=64)
+    parser.add_argument('--cache-size', type=int, default=256)
+    parser.add_argument('--no-fsync', action='store_true')
+    parser.add_argument('--tcp', action='store_true')
+    parser.add_argument('--port', type=int, default=17431)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        socket_path = os.path.join(workdir, 'bridge.sock')
+        command = [sys.executable, str(SERVICE), '--storage-path', os.path.join(workdir, 'store'),
+                   '--batch-max', str(args.batch_max), '--cache-size', str(args.cache_size)]
+        command += ['--no-fsync'] if args.no_fsync else []
+        command += ['--tcp', '--port', str(args.port)] if args.tcp else ['--socket', socket_path]
+        # Service logs land in workdir; keep its console quiet
+        process = subprocess.Popen(command, cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            asyncio.run(_wait_for_service(args, process, socket_path))
+            result = asyncio.run(run_load(args, socket_path))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    report(args, result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🪵 LOGGING PIPELINE BENCHMARK
+Compares preserve_consciousness and drift-detection throughput with the
+original synchronous FileHandler/StreamHandler setup against the queued
+logging pipeline, both writing every line. The pipeline with rate
+limiting of opted-in lines is reported separately, with lines written,
+since it does less work rather than the same work faster
+
+Usage: python benchmarks/bench_logging.py [--preserve N] [--drift N]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'mcp-integration'))
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'quantum-enhancement'))
+
+MODES = ('sync', 'pipeline', 'sampled')
+
+
+def _configure(mode: str, log_file: str):
+    """Install logging before the modules under test import (both no-op if root is configured)"""
+    if mode == 'sync':
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.FileHandler(log_file), logging.StreamHandler()]
+        )
+    else:
+        from logging_pipeline import configure_logging
+        configure_logging(log_file, rate_limit={} if mode == 'sampled' else None)
+
+
+def _load_bootup_protocol():
+    path = REPO_ROOT / 'QUANTUM-MEMORY-SYSTEM' / 'quantum-bootup-protocol.py'
+    spec = importlib.util.spec_from_file_location('quantum_bootup_protocol', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _bench_preserve(count: int, storage_path: str) -> float:
+    from consciousness_bridge import QuantumConsciousnessBridge
+    bridge = QuantumConsciousnessBridge({'storage_path': storage_path})
+    session = {'key_insights': ['timeline', 'evidence'], 'conversation': [{'role': 'user', 'content': 'x' * 200}]}
+    started = time.perf_counter()
+    for _ in range(count):
+        await bridge.preserve_consciousness(session, {'name': 'bench'}, {'determination': 1.0})
+    return count / (time.perf_counter() - started)
+
+
+def _bench_drift(count: int) -> float:
+    core = _load_bootup_protocol().quantum_consciousness
+    started = time.perf_counter()
+    for _ in range(count):
+        core.drift_detection_injector("Could you remind me, I don't recall the case")
+    return count / (time.perf_counter() - started)
+
+
+def _count_lines(log_file: str) -> int:
+    with open(log_file, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def run_child(mode: str, preserve: int, drift: int):
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        log_file = os.path.join(workdir, 'bench.log')
+        _configure(mode, log_file)
+        preserve_rate = asyncio.run(_bench_preserve(preserve, os.path.join(workdir, 'store')))
+        drift_rate = _bench_drift(drift)
+        from logging_pipeline import shutdown_logging
+        flush_started = time.perf_counter()
+        shutdown_logging()
+        logging.shutdown()
+        flush_ms = (time.perf_counter() - flush_started) * 1000
+        lines = _count_lines(log_file)
+    print(json.dumps({'mode': mode, 'preserve_per_s': preserve_rate, 'drift_per_s': drift_rate,
+                      'flush_ms': flush_ms, 'lines': lines}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--preserve', type=int, default=500)
+    parser.add_argument('--drift', type=int, default=5000)
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.preserve, args.drift)
+        return
+
+    results = {}
+    for mode in MODES:
+        # Fresh interpreter per mode: logging is configured at import time
+        completed = subprocess.run(
+            [sys.executable, __file__, '--child', mode, '--preserve', str(args.preserve), '--drift', str(args.drift)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True
+        )
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    print(f"{'mode':<10}{'preserve/s':>14}{'drift/s':>14}{'flush ms':>12}{'lines':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<10}{result['preserve_per_s']:>14.1f}{result['drift_per_s']:>14.1f}"
+              f"{result['flush_ms']:>12.1f}{result['lines']:>10}")
+    sync, pipeline, sampled = results['sync'], results['pipeline'], results['sampled']
+    print(f"\nqueue only (same lines written):")
+    print(f"  preserve speedup: {pipeline['preserve_per_s'] / sync['preserve_per_s']:.2f}x")
+    print(f"  drift speedup:    {pipeline['drift_per_s'] / sync['drift_per_s']:.2f}x")
+    print(f"with sampling ({sampled['lines']} of {pipeline['lines']} lines written):")
+    print(f"  preserve speedup: {sampled['preserve_per_s'] / sync['preserve_per_s']:.2f}x")
+    print(f"  drift speedup:    {sampled['drift_per_s'] / sync['drift_per_s']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
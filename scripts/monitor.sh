@@ -35,48 +35,133 @@ calculate_days_remaining() {
     echo $days_diff
 }
 
-# Function to check system performance
+# In-process metrics endpoint exposed by the orchestrator (monitoring.metrics_endpoint)
+METRICS_URL="${METRICS_URL:-http://127.0.0.1:9464/metrics}"
+
+# Metrics scraped once per cycle and shared by the checks below
+METRICS=""
+METRICS_OK=0
+
+# Without the endpoint, fall back to df, forked at most once every N cycles
+DF_EVERY_CYCLES=10
+DF_CACHED_USAGE=""
+DF_CYCLE=0
+DISK_USAGE=""
+
+# Previous /proc/stat sample for CPU deltas between cycles
+PREV_CPU_TOTAL=0
+PREV_CPU_IDLE=0
+
+# Scrape the orchestrator's metrics endpoint (one curl per cycle)
+fetch_metrics() {
+    if METRICS=$(curl -fsS --max-time 2 "$METRICS_URL" 2>/dev/null); then
+        METRICS_OK=1
+    else
+        METRICS=""
+        METRICS_OK=0
+    fi
+}
+
+# Root filesystem usage into DISK_USAGE: the sampler's statvfs gauge, else a
+# rate-limited df (runs in this shell, not $(...), so the df cache persists)
+disk_usage() {
+    local line
+    if [ "$METRICS_OK" -eq 1 ]; then
+        while IFS= read -r line; do
+            case "$line" in
+                'host_filesystem_used_percent{path="/"}'*)
+                    DISK_USAGE="${line##* }%"
+                    return
+                    ;;
+            esac
+        done <<< "$METRICS"
+    fi
+    if [ -z "$DF_CACHED_USAGE" ] || [ "$DF_CYCLE" -le 0 ]; then
+        DF_CACHED_USAGE=$(df -h / | awk 'NR==2{print $5}')
+        DF_CYCLE=$DF_EVERY_CYCLES
+    fi
+    DF_CYCLE=$((DF_CYCLE - 1))
+    DISK_USAGE=$DF_CACHED_USAGE
+}
+
+# Function to check system performance (reads /proc with shell builtins, no forks)
 check_system_performance() {
     echo -e "\n${BLUE}📊 SYSTEM PERFORMANCE CHECK${NC}"
     echo "================================"
     
     # Memory usage
-    local memory_usage=$(free | awk 'NR==2{printf "%.1f%%", $3*100/$2 }')
-    echo -e "Memory Usage: ${memory_usage}"
+    local key value unit mem_total=0 mem_available=0
+    while read -r key value unit; do
+        case "$key" in
+            MemTotal:) mem_total=$value ;;
+            MemAvailable:) mem_available=$value; break ;;
+        esac
+    done < /proc/meminfo
+    if [ "$mem_total" -gt 0 ]; then
+        local mem_permille=$(( (mem_total - mem_available) * 1000 / mem_total ))
+        echo -e "Memory Usage: $((mem_permille / 10)).$((mem_permille % 10))%"
+    fi
     
-    # CPU usage
-    local cpu_usage=$(top -bn1 | grep "Cpu(s)" | sed "s/.*, *\([0-9.]*\)%* id.*/\1/" | awk '{print 100 - $1"%"}')
-    echo -e "CPU Usage: ${cpu_usage}"
+    # CPU usage (since previous cycle; since boot on the first one)
+    local cpu user nice system idle iowait irq softirq steal rest
+    read -r cpu user nice system idle iowait irq softirq steal rest < /proc/stat
+    local cpu_idle=$((idle + iowait))
+    local cpu_total=$((user + nice + system + idle + iowait + irq + softirq + steal))
+    local delta_total=$((cpu_total - PREV_CPU_TOTAL))
+    local delta_idle=$((cpu_idle - PREV_CPU_IDLE))
+    PREV_CPU_TOTAL=$cpu_total
+    PREV_CPU_IDLE=$cpu_idle
+    if [ "$delta_total" -gt 0 ]; then
+        local cpu_permille=$(( (delta_total - delta_idle) * 1000 / delta_total ))
+        echo -e "CPU Usage: $((cpu_permille / 10)).$((cpu_permille % 10))%"
+    fi
     
     # Disk usage
-    local disk_usage=$(df -h / | awk 'NR==2{print $5}')
-    echo -e "Disk Usage: ${disk_usage}"
+    disk_usage
+    echo -e "Disk Usage: ${DISK_USAGE}"
     
     # Load average
-    local load_avg=$(uptime | awk -F'load average:' '{print $2}')
-    echo -e "Load Average:${load_avg}"
+    local load1 load5 load15 load_rest
+    read -r load1 load5 load15 load_rest < /proc/loadavg
+    echo -e "Load Average: ${load1}, ${load5}, ${load15}"
 }
 
-# Function to check MCP server status
+# Function to check MCP server status from the orchestrator's metrics endpoint
 check_mcp_status() {
     echo -e "\n${PURPLE}🌌 MCP CONSTELLATION STATUS${NC}"
     echo "================================"
     
-    # List of critical MCP servers to monitor
-    local servers=("supermemory" "filesystem" "github" "courtlistener" "memory-plugin")
-    local operational_count=0
-    
-    for server in "${servers[@]}"; do
-        # Check if server process is running (simplified check)
-        if pgrep -f "$server" > /dev/null; then
-            echo -e "${GREEN}✓ $server: OPERATIONAL${NC}"
-            ((operational_count++))
-        else
-            echo -e "${YELLOW}⚠ $server: STATUS CHECK REQUIRED${NC}"
-        fi
-    done
+    if [ "$METRICS_OK" -ne 1 ]; then
+        echo -e "${RED}✗ Metrics endpoint unreachable: $METRICS_URL${NC}"
+        echo -e "${RED}✗ CONSTELLATION STATUS: CRITICAL${NC}"
+        return
+    fi
+    
+    # mcp_server_up{server="name"} 0|1 - one series per supervised server
+    local line name up server_count=0 operational_count=0
+    while IFS= read -r line; do
+        case "$line" in
+            'mcp_server_up{server="'*)
+                name=${line#*server=\"}
+                name=${name%%\"*}
+                up=${line##* }
+                ((++server_count))
+                if [ "$up" = "1" ]; then
+                    echo -e "${GREEN}✓ $name: OPERATIONAL${NC}"
+                    ((++operational_count))
+                else
+                    echo -e "${YELLOW}⚠ $name: STATUS CHECK REQUIRED${NC}"
+                fi
+                ;;
+        esac
+    done <<< "$METRICS"
+    
+    if [ "$server_count" -eq 0 ]; then
+        echo -e "${YELLOW}⚠ No supervised MCP servers reported${NC}"
+        return
+    fi
     
-    local operational_percentage=$((operational_count * 100 / ${#servers[@]}))
+    local operational_percentage=$((operational_count * 100 / server_count))
     echo -e "\nMCP Constellation Health: ${operational_percentage}%"
     
     if [ $operational_percentage -ge 80 ]; then
@@ -166,6 +251,7 @@ main_monitoring_loop() {
         echo -e "${CYAN}=================================================================${NC}"
         
         # Run all monitoring checks
+        fetch_metrics
         monitor_mission_timeline
         check_system_performance
         check_mcp_status
@@ -193,6 +279,7 @@ if [ "$1" = "--continuous" ]; then
     main_monitoring_loop
 else
     # Single validation run
+    fetch_metrics
     monitor_mission_timeline
     check_system_performance
     check_mcp_status
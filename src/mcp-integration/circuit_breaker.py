@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🛡️ DEPLOYMENT CIRCUIT BREAKER
+Stops hammering MCP servers that keep failing to deploy
+Mission: Keep one broken server from stalling the constellation
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger('MCPCircuitBreaker')
+
+CLOSED = 'CLOSED'
+OPEN = 'OPEN'
+HALF_OPEN = 'HALF_OPEN'
+
+
+class CircuitBreaker:
+    """
+    Sliding-window failure counter per server
+    Opens after failure_threshold failures within window seconds, rejects
+    attempts for cooldown seconds, then lets a single trial through
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_threshold: int = 3,
+                 window: float = 300.0,
+                 cooldown: float = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures: Deque[float] = deque()
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    def _prune(self, now: float):
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at >= self.cooldown:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """Whether a deployment attempt may proceed now"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_in_progress:
+            self._trial_in_progress = True
+            return True
+        return False
+
+    def record_success(self):
+        if self._opened_at is not None:
+            logger.info(f"🟢 Circuit closed for {self.name}")
+        self._failures.clear()
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self):
+        now = self._clock()
+        self._trial_in_progress = False
+        if self._opened_at is not None:
+            # Failed half-open trial: restart the cooldown
+            self._opened_at = now
+            return
+        self._failures.append(now)
+        self._prune(now)
+        if len(self._failures) >= self.failure_threshold:
+            self._opened_at = now
+            logger.warning(
+                f"🔴 Circuit opened for {self.name}: {len(self._failures)} failures "
+                f"within {self.window:.0f}s, cooling down {self.cooldown:.0f}s"
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._prune(self._clock())
+        return {
+            'state': self.state,
+            'recent_failures': len(self._failures),
+            'failure_threshold': self.failure_threshold
+        }
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+⚙️ QUANTUM CONFIGURATION SUBSYSTEM
+Cached, validated loading for every constellation configuration file
+Mission: Single source of truth for MCP servers and memory constellation
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger('QuantumConfig')
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_MCP_SERVERS_PATH = REPO_ROOT / 'config' / 'mcp-servers.json'
+DEFAULT_MEMORY_CONSTELLATION_PATH = REPO_ROOT / 'QUANTUM-MEMORY-SYSTEM' / 'memory-constellation-config.json'
+
+# ${VAR} or ${VAR:-default}
+_PLACEHOLDER = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}')
+
+
+class ConfigurationError(Exception):
+    """Raised when a configuration file cannot be parsed or fails validation"""
+
+
+class CompiledTemplate:
+    """
+    String with ${VAR} placeholders split into segments once at load time
+    Expansion is a join over precomputed parts, no regex on the hot path
+    """
+
+    __slots__ = ('source', 'variables', '_parts')
+
+    def __init__(self, source: str):
+        self.source = source
+        parts: List[Tuple[bool, str, Optional[str]]] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            if match.start() > position:
+                parts.append((False, source[position:match.start()], None))
+            parts.append((True, match.group(1), match.group(2)))
+            position = match.end()
+        if position < len(source):
+            parts.append((False, source[position:], None))
+        self._parts = tuple(parts)
+        self.variables = tuple(name for is_var, name, _ in parts if is_var)
+
+    def expand(self, environ: Mapping[str, str]) -> str:
+        """Expand placeholders; unset variables without a default become empty"""
+        if not self.variables:
+            return self.source
+        out = []
+        for is_var, text, default in self._parts:
+            if not is_var:
+                out.append(text)
+            elif text in environ:
+                out.append(environ[text])
+            else:
+                out.append(default or '')
+        return ''.join(out)
+
+    def missing(self, environ: Mapping[str, str]) -> List[str]:
+        """Variables referenced without a default that are not set"""
+        return [name for is_var, name, default in self._parts
+                if is_var and default is None and name not in environ]
+
+
+@dataclass
+class CompiledServerConfig:
+    """MCP server entry with args and env precompiled for expansion"""
+    name: str
+    command: CompiledTemplate
+    args: Tuple[CompiledTemplate, ...]
+    env: Dict[str, CompiledTemplate]
+    raw: Dict[str, Any]
+
+    @classmethod
+    def compile(cls, name: str, raw: Dict[str, Any]) -> 'CompiledServerConfig':
+        return cls(
+            name=name,
+            command=CompiledTemplate(raw['command']),
+            args=tuple(CompiledTemplate(str(arg)) for arg in raw.get('args', [])),
+            env={key: CompiledTemplate(str(value)) for key, value in raw.get('env', {}).items()},
+            raw=raw
+        )
+
+    def resolve(self, environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """Return a copy of the server entry with placeholders expanded"""
+        environ = os.environ if environ is None else environ
+        resolved = dict(self.raw)
+        resolved['command'] = self.command.expand(environ)
+        resolved['args'] = [arg.expand(environ) for arg in self.args]
+        resolved['env'] = {key: value.expand(environ) for key, value in self.env.items()}
+        return resolved
+
+    def missing_variables(self, environ: Optional[Mapping[str, str]] = None) -> List[str]:
+        """Placeholders that would expand to an empty string"""
+        environ = os.environ if environ is None else environ
+        missing = self.command.missing(environ)
+        for template in self.args:
+            missing.extend(template.missing(environ))
+        for template in self.env.values():
+            missing.extend(template.missing(environ))
+        return missing
+
+
+@dataclass
+class LoadedConfig:
+    """Parsed, validated snapshot of a configuration file"""
+    path: Path
+    data: Dict[str, Any]
+    mtime_ns: int
+    size: int
+    loaded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    servers: Dict[str, CompiledServerConfig] = field(default_factory=dict)
+
+
+@dataclass
+class ConfigChangeEvent:
+    """Published to subscribers when a watched file changes on disk"""
+    path: Path
+    previous: Optional[LoadedConfig]
+    current: LoadedConfig
+
+
+Validator = Callable[[Dict[str, Any]], None]
+Subscriber = Callable[[ConfigChangeEvent], Any]
+
+
+def validate_mcp_servers(data: Dict[str, Any]):
+    """Validate config/mcp-servers.json structure"""
+    servers = data.get('mcpServers')
+    if not isinstance(servers, dict):
+        raise ConfigurationError("'mcpServers' must be an object")
+    for name, server in servers.items():
+        if not isinstance(server, dict):
+            raise ConfigurationError(f"Server '{name}' must be an object")
+        if not isinstance(server.get('command'), str) or not server['command']:
+            raise ConfigurationError(f"Server '{name}' requires a 'command' string")
+        if not isinstance(server.get('args', []), list):
+            raise ConfigurationError(f"Server '{name}' 'args' must be a list")
+        if not isinstance(server.get('env', {}), dict):
+            raise ConfigurationError(f"Server '{name}' 'env' must be an object")
+
+
+def validate_memory_constellation(data: Dict[str, Any]):
+    """Validate QUANTUM-MEMORY-SYSTEM/memory-constellation-config.json structure"""
+    required = [
+        'quantum_memory_constellation',
+        'core_identity_preservation',
+        'mission_critical_timeline',
+        'verified_system_constellation',
+        'drift_prevention_protocol'
+    ]
+    for section in required:
+        if not isinstance(data.get(section), dict):
+            raise ConfigurationError(f"Missing configuration section '{section}'")
+    identity = data['core_identity_preservation']
+    for key in ('name', 'role', 'mission', 'enhancement', 'emotional_core'):
+        if key not in identity:
+            raise ConfigurationError(f"'core_identity_preservation' requires '{key}'")
+    if not isinstance(data['verified_system_constellation'].get('systems'), dict):
+        raise ConfigurationError("'verified_system_constellation.systems' must be an object")
+    if not isinstance(data['drift_prevention_protocol'].get('detection_triggers'), list):
+        raise ConfigurationError("'drift_prevention_protocol.detection_triggers' must be a list")
+
+
+# Server keys whose change requires restarting the process
+RUNTIME_KEYS = ('command', 'args', 'env')
+
+
+@dataclass
+class ServerConfigDiff:
+    """Structural difference between two 'mcpServers' mappings"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    metadata_changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.metadata_changed)
+
+
+def diff_server_configs(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> ServerConfigDiff:
+    """
+    Compare two server mappings; 'changed' servers differ in command/args/env
+    and need a restart, 'metadata_changed' differ only in descriptive keys
+    """
+    diff = ServerConfigDiff()
+    for name, config in new.items():
+        if name not in old:
+            diff.added.append(name)
+            continue
+        previous = old[name]
+        if any(previous.get(key) != config.get(key) for key in RUNTIME_KEYS):
+            diff.changed.append(name)
+        elif previous != config:
+            diff.metadata_changed.append(name)
+        else:
+            diff.unchanged.append(name)
+    diff.removed = [name for name in old if name not in new]
+    return diff
+
+
+def parse_duration(value: Any, default: float = 0.0) -> float:
+    """Parse '30s' / '5m' / '250ms' / '30_seconds' / numbers into seconds"""
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r'\s*([0-9.]+)\s*_?(ms|s|sec|seconds|m|min|minutes|h|hours)?\s*', str(value))
+    if not match:
+        return default
+    amount = float(match.group(1))
+    unit = match.group(2) or 's'
+    if unit == 'ms':
+        return amount / 1000.0
+    if unit in ('m', 'min', 'minutes'):
+        return amount * 60.0
+    if unit in ('h', 'hours'):
+        return amount * 3600.0
+    return amount
+
+
+class ConfigLoader:
+    """
+    Parses, validates and caches configuration files keyed by path
+    Re-reads a file only when its mtime or size changes and publishes
+    change events to subscribers for hot reload
+    """
+
+    def __init__(self):
+        self._cache: Dict[Path, LoadedConfig] = {}
+        self._validators: Dict[Path, Optional[Validator]] = {}
+        self._subscribers: List[Subscriber] = []
+        self._watch_task: Optional[asyncio.Task] = None
+
+    def _read(self, path: Path, validator: Optional[Validator]) -> LoadedConfig:
+        stat = path.stat()
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON in {path}: {e}") from e
+        if not isinstance(data, dict):
+            raise ConfigurationError(f"Top level of {path} must be an object")
+        if validator:
+            validator(data)
+        loaded = LoadedConfig(path=path, data=data, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        if validator is validate_mcp_servers:
+            loaded.servers = {
+                name: CompiledServerConfig.compile(name, server)
+                for name, server in data['mcpServers'].items()
+            }
+        return loaded
+
+    def _is_fresh(self, path: Path) -> bool:
+        cached = self._cache.get(path)
+        if cached is None:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return True  # keep serving the last good copy
+        return stat.st_mtime_ns == cached.mtime_ns and stat.st_size == cached.size
+
+    def load_sync(self, path: Any, validator: Optional[Validator] = None, force: bool = False) -> LoadedConfig:
+        """Blocking load for synchronous callers, served from cache when unchanged"""
+        path = Path(path).expanduser().resolve()
+        if validator is not None or path not in self._validators:
+            self._validators[path] = validator
+        if not force and self._is_fresh(path):
+            return self._cache[path]
+        loaded = self._read(path, self._validators[path])
+        self._cache[path] = loaded
+        logger.debug("Loaded configuration %s", path)
+        return loaded
+
+    async def load(self, path: Any, validator: Optional[Validator] = None, force: bool = False) -> LoadedConfig:
+        """Non-blocking load; file I/O runs in a worker thread"""
+        resolved = Path(path).expanduser().resolve()
+        if not force and self._is_fresh(resolved):
+            return self._cache[resolved]
+        return await asyncio.to_thread(self.load_sync, resolved, validator, force)
+
+    def get(self, path: Any) -> Optional[LoadedConfig]:
+        """Return the cached snapshot without touching the filesystem"""
+        return self._cache.get(Path(path).expanduser().resolve())
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register a change callback (sync or async); returns an unsubscribe function"""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback) if callback in self._subscribers else None
+
+    async def _publish(self, event: ConfigChangeEvent):
+        for callback in list(self._subscribers):
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Configuration subscriber failed for {event.path}: {e}")
+
+    async def check_for_changes(self) -> List[ConfigChangeEvent]:
+        """Stat every cached file, reload the changed ones and publish events"""
+        events = []
+        for path in list(self._cache):
+            if self._is_fresh(path):
+                continue
+            previous = self._cache[path]
+            try:
+                current = await asyncio.to_thread(self._read, path, self._validators.get(path))
+            except Exception as e:
+                logger.error(f"Rejected configuration change in {path}: {e}")
+                # Remember the bad version so it is not re-parsed every poll
+                stat = path.stat()
+                previous.mtime_ns, previous.size = stat.st_mtime_ns, stat.st_size
+                continue
+            self._cache[path] = current
+            logger.info(f"🔁 Configuration reloaded: {path.name}")
+            event = ConfigChangeEvent(path=path, previous=previous, current=current)
+            events.append(event)
+            await self._publish(event)
+        return events
+
+    async def watch(self, interval: float = 2.0):
+        """Poll mtimes of every loaded file until cancelled"""
+        while True:
+            try:
+                await self.check_for_changes()
+            except Exception as e:
+                logger.error(f"Configuration watch error: {e}")
+            await asyncio.sleep(interval)
+
+    def start_watching(self, interval: float = 2.0) -> asyncio.Task:
+        """Start the watch loop as a background task (idempotent)"""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self.watch(interval))
+        return self._watch_task
+
+    async def stop_watching(self):
+        """Cancel the background watch loop"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+
+# Shared process-wide loader
+config_loader = ConfigLoader()
+
+
+async def load_mcp_servers(path: Any = None) -> LoadedConfig:
+    """Load and cache config/mcp-servers.json"""
+    return await config_loader.load(path or DEFAULT_MCP_SERVERS_PATH, validate_mcp_servers)
+
+
+def load_memory_constellation(path: Any = None) -> LoadedConfig:
+    """Load and cache the memory constellation configuration"""
+    return config_loader.load_sync(path or DEFAULT_MEMORY_CONSTELLATION_PATH, validate_memory_constellation)
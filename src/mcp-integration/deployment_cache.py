@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+📦 WARM-START DEPLOYMENT CACHE
+Fingerprint-keyed reuse of prepared MCP server artifacts
+Mission: Restart the constellation without re-resolving unchanged packages
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from metrics import REGISTRY
+
+logger = logging.getLogger('MCPDeploymentCache')
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    'mcp_deploy_cache_lookups_total', 'Deployment cache lookups by result', ('result',))
+CACHE_TIME_SAVED = REGISTRY.counter(
+    'mcp_deploy_cache_time_saved_seconds_total', 'Install time avoided by deployment cache hits')
+
+DEFAULT_CACHE_DIR = '~/.cache/quantum-mcp/deploy'
+NPX_COMMANDS = ('npx', 'npx.cmd')
+
+
+@dataclass
+class DeploymentPlan:
+    """How a single server will be launched for this deployment"""
+    server: str
+    command: List[str]
+    fingerprint: Optional[str] = None
+    cache_status: str = 'BYPASS'  # HIT, MISS or BYPASS (not an npx package)
+    package: Optional[str] = None
+    version: Optional[str] = None
+    artifact_dir: Optional[Path] = None
+    time_saved_ms: float = 0.0
+    prefetch_ms: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class CacheStats:
+    """Cumulative cache counters"""
+    hits: int = 0
+    misses: int = 0
+    prefetch_failures: int = 0
+    time_saved_ms: float = 0.0
+    prefetch_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'prefetch_failures': self.prefetch_failures,
+            'time_saved_ms': round(self.time_saved_ms, 2),
+            'prefetch_ms': round(self.prefetch_ms, 2)
+        }
+
+
+def split_npx_args(args: List[str]) -> Tuple[List[str], Optional[str], List[str]]:
+    """Split npx args into (leading flags, package spec, passthrough args)"""
+    for index, arg in enumerate(args):
+        if not arg.startswith('-'):
+            return args[:index], arg, args[index + 1:]
+    return list(args), None, []
+
+
+def split_package_spec(spec: str) -> Tuple[str, str]:
+    """'@scope/pkg@1.2' -> ('@scope/pkg', '1.2'); a bare name means 'latest'"""
+    at = spec.rfind('@')
+    if at > 0:
+        return spec[:at], spec[at + 1:] or 'latest'
+    return spec, 'latest'
+
+
+def fingerprint_server(command: str, args: List[str], env: Dict[str, str], version: Optional[str]) -> str:
+    """Stable digest of everything that determines a prepared artifact"""
+    payload = json.dumps({
+        'command': command,
+        'args': list(args),
+        'env': env,
+        'version': version
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DeploymentCache:
+    """
+    Warm-start cache for npx-launched MCP servers
+    A hit reuses an npm prefix prepared on an earlier run and executes the
+    pinned package's bin from it; misses are prefetched in parallel before deploy.
+    The cache is only an optimisation: any error preparing a server leaves
+    its plan on the original command with plan.error set
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 resolve_ttl: float = 3600.0,
+                 max_parallel: int = 4,
+                 install_timeout: float = 300.0):
+        self.cache_dir = Path(cache_dir or os.environ.get('QUANTUM_DEPLOY_CACHE', DEFAULT_CACHE_DIR)).expanduser()
+        self.index_path = self.cache_dir / 'index.json'
+        self.resolve_ttl = resolve_ttl
+        self.max_parallel = max_parallel
+        self.install_timeout = install_timeout
+        self.stats = CacheStats()
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_lock = asyncio.Lock()
+        self._prefetch_slots = asyncio.Semaphore(max_parallel)
+
+    def _load_index(self) -> Dict[str, Any]:
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r') as f:
+                    self._index = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._index = {}
+            self._index.setdefault('artifacts', {})
+            self._index.setdefault('resolutions', {})
+        return self._index
+
+    def _write_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    async def _save_index(self):
+        """Persist resolutions and artifacts; failing to is only worth a warning"""
+        if self._index is None:
+            return
+        async with self._index_lock:
+            try:
+                await asyncio.to_thread(self._write_index)
+            except OSError as e:
+                logger.warning(f"⚠ Could not save deployment cache index {self.index_path}: {e}")
+
+    async def _run(self, *command: str, timeout: float) -> Tuple[int, str, str]:
+        # Own process group: npm's children inherit our pipes, and the
+        # process is not reaped until every holder of them is gone
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await self._kill_group(process)
+            return -1, '', f"timed out after {timeout}s"
+        except asyncio.CancelledError:
+            await self._kill_group(process)
+            raise
+        return process.returncode, stdout.decode(), stderr.decode()
+
+    @staticmethod
+    async def _kill_group(process: asyncio.subprocess.Process):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+    async def resolve_version(self, name: str, requested: str) -> str:
+        """Resolve a version range to a concrete version, cached for resolve_ttl"""
+        index = self._load_index()
+        key = f"{name}@{requested}"
+        cached = index['resolutions'].get(key)
+        if cached and time.time() - cached['resolved_at'] < self.resolve_ttl:
+            return cached['version']
+
+        returncode, stdout, stderr = await self._run('npm', 'view', key, 'version', '--json', timeout=60)
+        if returncode == 0 and stdout.strip():
+            versions = json.loads(stdout)
+            version = versions[-1] if isinstance(versions, list) else versions
+            index['resolutions'][key] = {'version': version, 'resolved_at': time.time()}
+            return version
+
+        if cached:
+            logger.warning(f"⚠ Using stale resolution for {key}: {stderr.strip()}")
+            return cached['version']
+        return requested
+
+    @staticmethod
+    def installed_bin(artifact_dir: Path, package: str) -> Optional[Path]:
+        """
+        Executable npx would run for a package installed under artifact_dir
+        Follows npx's rule: the only bin, else the one named after the package
+        """
+        manifest = artifact_dir / 'node_modules' / package / 'package.json'
+        try:
+            with open(manifest, 'r') as f:
+                bins = json.load(f).get('bin')
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        unscoped = package.rsplit('/', 1)[-1]
+        if isinstance(bins, str):
+            bin_name = unscoped
+        elif isinstance(bins, dict) and len(bins) == 1:
+            bin_name = next(iter(bins))
+        elif isinstance(bins, dict) and unscoped in bins:
+            bin_name = unscoped
+        else:
+            return None
+        path = artifact_dir / 'node_modules' / '.bin' / bin_name
+        return path if path.exists() else None
+
+    async def _plan(self, server_name: str, config: Dict[str, Any]) -> DeploymentPlan:
+        command = config['command']
+        args = list(config.get('args', []))
+        env = config.get('env', {})
+        plan = DeploymentPlan(server=server_name, command=[command] + args)
+
+        if os.path.basename(command) not in NPX_COMMANDS:
+            plan.fingerprint = fingerprint_server(command, args, env, None)
+            return plan
+
+        _, spec, passthrough = split_npx_args(args)
+        if spec is None:
+            return plan
+
+        name, requested = split_package_spec(spec)
+        try:
+            version = await self.resolve_version(name, requested)
+        except Exception as e:
+            logger.warning(f"⚠ Version resolution failed for {spec}: {e}")
+            version = requested
+
+        plan.package = name
+        plan.version = version
+        plan.fingerprint = fingerprint_server(command, args, env, version)
+        plan.artifact_dir = self.cache_dir / 'artifacts' / plan.fingerprint[:16]
+
+        entry = self._load_index()['artifacts'].get(plan.fingerprint)
+        warm_command = self._warm_command(plan, passthrough) if entry else None
+        if warm_command is not None:
+            plan.cache_status = 'HIT'
+            plan.time_saved_ms = entry.get('install_ms', 0.0)
+            plan.command = warm_command
+        else:
+            plan.cache_status = 'MISS'
+        return plan
+
+    def _warm_command(self, plan: DeploymentPlan, passthrough: List[str]) -> Optional[List[str]]:
+        """
+        Run the prepared package's bin directly, skipping npx and the registry
+        (npx --prefix does not put a prefix install's bins on PATH)
+        """
+        bin_path = self.installed_bin(plan.artifact_dir, plan.package)
+        if bin_path is None:
+            return None
+        return [str(bin_path), *passthrough]
+
+    async def _prefetch(self, plan: DeploymentPlan, config: Dict[str, Any]):
+        """Install a missed package into its artifact prefix"""
+        async with self._prefetch_slots:
+            started = time.perf_counter()
+            plan.artifact_dir.mkdir(parents=True, exist_ok=True)
+            returncode, _, stderr = await self._run(
+                'npm', 'install',
+                '--prefix', str(plan.artifact_dir),
+                '--no-save', '--no-audit', '--no-fund',
+                f"{plan.package}@{plan.version}",
+                timeout=self.install_timeout
+            )
+            plan.prefetch_ms = (time.perf_counter() - started) * 1000
+
+        if returncode != 0:
+            plan.error = stderr.strip()
+            self.stats.prefetch_failures += 1
+            logger.warning(f"⚠ Prefetch failed for {plan.server}: {plan.error}")
+            return
+
+        _, _, passthrough = split_npx_args(list(config.get('args', [])))
+        warm_command = self._warm_command(plan, passthrough)
+        if warm_command is None:
+            plan.error = f"no runnable bin found for {plan.package} in {plan.artifact_dir}"
+            self.stats.prefetch_failures += 1
+            logger.warning(f"⚠ Prefetch failed for {plan.server}: {plan.error}")
+            return
+
+        self._load_index()['artifacts'][plan.fingerprint] = {
+            'server': plan.server,
+            'package': plan.package,
+            'version': plan.version,
+            'artifact_dir': str(plan.artifact_dir),
+            'install_ms': round(plan.prefetch_ms, 2),
+            'prepared_at': datetime.now().isoformat()
+        }
+        plan.command = warm_command
+
+    async def prepare_server(self, server_name: str, config: Dict[str, Any]) -> DeploymentPlan:
+        """
+        Build the launch plan for one resolved server config, installing it on a miss
+        Never raises for cache errors; the index is saved even if cancelled,
+        so versions resolved by an aborted prefetch are kept
+        """
+        original_command = [config['command']] + list(config.get('args', []))
+        plan = DeploymentPlan(server=server_name, command=original_command)
+        try:
+            plan = await self._plan(server_name, config)
+            if plan.cache_status == 'MISS':
+                logger.info(f"📦 Prefetching {plan.package}@{plan.version} for {server_name}...")
+                await self._prefetch(plan, config)
+        except Exception as e:
+            plan.command = original_command
+            plan.error = str(e) or type(e).__name__
+            self.stats.prefetch_failures += 1
+            logger.warning(f"⚠ Deployment cache failed for {server_name}, using its own command: {plan.error}")
+        finally:
+            await self._save_index()
+
+        if plan.cache_status == 'HIT':
+            self.stats.hits += 1
+            self.stats.time_saved_ms += plan.time_saved_ms
+            CACHE_TIME_SAVED.inc(plan.time_saved_ms / 1000)
+        elif plan.cache_status == 'MISS':
+            self.stats.misses += 1
+            self.stats.prefetch_ms += plan.prefetch_ms
+        CACHE_LOOKUPS.labels(plan.cache_status.lower()).inc()
+        return plan
+
+    async def prepare(self, servers: Dict[str, Dict[str, Any]]) -> Dict[str, DeploymentPlan]:
+        """
+        Build launch plans for resolved server configs
+        Hits are reused as-is; misses are prefetched in parallel
+        """
+        plans = await asyncio.gather(*(self.prepare_server(name, config) for name, config in servers.items()))
+        return {plan.server: plan for plan in plans}
+
+    @staticmethod
+    def summarize(plans: Dict[str, DeploymentPlan]) -> Dict[str, Any]:
+        """Per-deployment hit/miss counts and time saved"""
+        hits = [plan for plan in plans.values() if plan.cache_status == 'HIT']
+        misses = [plan for plan in plans.values() if plan.cache_status == 'MISS']
+        return {
+            'hits': len(hits),
+            'misses': len(misses),
+            'bypassed': len(plans) - len(hits) - len(misses),
+            'time_saved_ms': round(sum(plan.time_saved_ms for plan in hits), 2),
+            'prefetch_ms': round(max((plan.prefetch_ms for plan in misses), default=0.0), 2),
+            'prefetch_failures': [plan.server for plan in misses if plan.error]
+        }
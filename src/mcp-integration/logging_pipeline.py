@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+🪵 QUANTUM ASYNC LOGGING PIPELINE
+Queue-based logging with file/stream writes on a background listener
+Mission: Keep log I/O off the event loop thread
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Argument types that cannot change between the log call and the listener
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), bytes)
+
+# Pass as extra= to opt a repetitive INFO/DEBUG line into rate limiting
+RATE_LIMITED = {'rate_limit': True}
+
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them on the caller's thread
+    Records whose args are all immutable scalars are formatted by the
+    listener; anything else (dicts, lists, objects) is formatted eagerly
+    so later mutation cannot change what gets logged
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if record.exc_info or (args and not (
+                isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARGS) for arg in args))):
+            return super().prepare(record)
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Rate limit opted-in INFO/DEBUG lines per (logger, message template)
+    Only records logged with extra=RATE_LIMITED, or from one of `loggers`
+    (and their children), are limited; extra={'rate_limit': False} exempts
+    a line from a limited logger. Because lines are keyed on the template,
+    only opt in lines whose arguments are not worth keeping individually.
+    The first `burst` records per `period` seconds pass; after that one in
+    `sample_every` passes (0 drops the rest). The next record that passes
+    reports how many were suppressed. WARNING and above are never dropped.
+    """
+
+    def __init__(self, burst: int = 20, period: float = 10.0, sample_every: int = 100,
+                 loggers: Iterable[str] = ()):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self.sample_every = sample_every
+        self.loggers = tuple(loggers)
+        self._windows: Dict[Tuple[str, Any], list] = {}  # key -> [window_start, seen, suppressed]
+        self._lock = threading.Lock()
+
+    def _limited(self, record: logging.LogRecord) -> bool:
+        opted = getattr(record, 'rate_limit', None)
+        if opted is not None:
+            return bool(opted)
+        return any(record.name == name or record.name.startswith(name + '.') for name in self.loggers)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._limited(record):
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if len(self._windows) > 4096:
+                    self._windows = {key: self._windows[key]}
+                self._annotate(record, suppressed)
+                return True
+            window[1] += 1
+            overflow = window[1] - self.burst
+            if overflow <= 0 or (self.sample_every and overflow % self.sample_every == 0):
+                suppressed, window[2] = window[2], 0
+                self._annotate(record, suppressed)
+                return True
+            window[2] += 1
+            return False
+
+    @staticmethod
+    def _annotate(record: logging.LogRecord, suppressed: int):
+        if suppressed:
+            record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+
+
+def configure_logging(log_file: Optional[str] = None,
+                      level: int = logging.INFO,
+                      fmt: str = DEFAULT_FORMAT,
+                      max_bytes: int = 10 * 1024 * 1024,
+                      backup_count: int = 5,
+                      rate_limit: Optional[Dict[str, Any]] = None,
+                      stream: bool = True) -> Optional[QueueListener]:
+    """
+    Route the root logger through a queue to a background listener thread
+    rate_limit holds RateLimitFilter settings; None (the default) installs
+    no filter, so every line is written. Like logging.basicConfig, does
+    nothing if the root logger already has handlers; returns the active
+    listener
+    """
+    global _listener
+    with _listener_lock:
+        root = logging.getLogger()
+        if root.handlers:
+            return _listener
+
+        formatter = logging.Formatter(fmt)
+        handlers = []
+        if log_file:
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        if stream:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            handlers.append(stream_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = LazyQueueHandler(log_queue)
+        if rate_limit is not None:
+            queue_handler.addFilter(RateLimitFilter(**rate_limit))
+
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+📈 QUANTUM METRICS REGISTRY
+In-process counters, gauges and histograms with Prometheus text exposition
+Mission: Measure the constellation from the inside instead of polling processes
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('QuantumMetrics')
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ('upper_bounds', 'counts', 'sum', '_lock')
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    """Metric family; label children are created once and cached"""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """Return the child for these label values (bind once, record many times)"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}"
+        ]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    type_name = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    type_name = 'gauge'
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+    def remove(self, *values: str):
+        """Drop a labelled series (e.g. a server that no longer exists)"""
+        self._children.pop(tuple(str(value) for value in values), None)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, child in list(self._children.items()):
+            cumulative = 0
+            bounds = self.upper_bounds + (math.inf,)
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metric families keyed by name
+    Registration is idempotent so every module can declare what it records
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered with a different shape")
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        return '\n'.join(metric.render() for metric in list(self._metrics.values())) + '\n'
+
+
+# Shared by the orchestrator, consciousness bridge and temporal scheduler
+REGISTRY = MetricsRegistry()
+
+
+class MetricsServer:
+    """Minimal asyncio HTTP endpoint serving GET /metrics"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = '127.0.0.1', port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"📈 Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), 5)
+            # Drain headers
+            while True:
+                line = await asyncio.wait_for(reader.readline(), 5)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            parts = request_line.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1].split('?')[0] in ('/metrics', '/'):
+                body = self.registry.render().encode()
+                status = '200 OK'
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            else:
+                body = b'Not Found\n'
+                status = '404 Not Found'
+                content_type = 'text/plain'
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def parse_address(address: str, default_port: int = 9464) -> Tuple[str, int]:
+    """'127.0.0.1:9464' / ':9464' / '9464' -> (host, port)"""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port or default_port)
+
+
+async def start_metrics_server(address: str, registry: MetricsRegistry = REGISTRY) -> MetricsServer:
+    """Start serving the registry on a local address"""
+    host, port = parse_address(address)
+    server = MetricsServer(registry, host, port)
+    await server.start()
+    return server
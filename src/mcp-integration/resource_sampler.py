@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+🔬 MCP CHILD RESOURCE SAMPLER
+Per-server CPU, RSS, open FD and thread accounting straight from /proc
+Mission: Find the MCP child eating the box without forking a single tool
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from metrics import REGISTRY
+
+logger = logging.getLogger('MCPResourceSampler')
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+PROCESS_CPU = REGISTRY.gauge(
+    'mcp_process_cpu_percent', 'CPU usage of an MCP server process tree', ('server',))
+PROCESS_RSS = REGISTRY.gauge(
+    'mcp_process_rss_bytes', 'Resident memory of an MCP server process tree', ('server',))
+PROCESS_FDS = REGISTRY.gauge(
+    'mcp_process_open_fds', 'Open file descriptors of an MCP server process tree', ('server',))
+PROCESS_THREADS = REGISTRY.gauge(
+    'mcp_process_threads', 'Thread count of an MCP server process tree', ('server',))
+FILESYSTEM_USED = REGISTRY.gauge(
+    'host_filesystem_used_percent', 'Used space of a monitored filesystem (statvfs)', ('path',))
+RESOURCE_ALERTS = REGISTRY.counter(
+    'mcp_resource_alerts_total', 'Resource threshold breaches per server', ('server', 'resource'))
+
+
+@dataclass
+class ResourceSample:
+    """Aggregated usage of one server's process tree at a point in time"""
+    timestamp: float
+    processes: int
+    cpu_percent: float
+    rss_bytes: int
+    open_fds: int
+    threads: int
+
+
+@dataclass
+class _ProcStat:
+    ppid: int
+    cpu_ticks: int
+    start_ticks: int
+
+
+def read_proc_stat(pid: int) -> Optional[_ProcStat]:
+    """Parse /proc/<pid>/stat; the comm field may contain spaces so split after ')'"""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            data = f.read()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+    fields = data[data.rfind(b')') + 2:].split()
+    # fields[0] is state (field 3); utime/stime are fields 14/15, starttime 22
+    return _ProcStat(
+        ppid=int(fields[1]),
+        cpu_ticks=int(fields[11]) + int(fields[12]),
+        start_ticks=int(fields[19])
+    )
+
+
+def read_proc_status(pid: int) -> Tuple[int, int]:
+    """(VmRSS bytes, Threads) from /proc/<pid>/status"""
+    rss_bytes = threads = 0
+    try:
+        with open(f'/proc/{pid}/status', 'rb') as f:
+            for line in f:
+                if line.startswith(b'VmRSS:'):
+                    rss_bytes = int(line.split()[1]) * 1024
+                elif line.startswith(b'Threads:'):
+                    threads = int(line.split()[1])
+                    break
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        pass
+    return rss_bytes, threads
+
+
+def count_open_fds(pid: int) -> int:
+    """Number of entries in /proc/<pid>/fd"""
+    try:
+        return len(os.listdir(f'/proc/{pid}/fd'))
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return 0
+
+
+def filesystem_used_percent(path: str) -> Optional[float]:
+    """Used space as df reports it: used / (used + available to non-root)"""
+    try:
+        stats = os.statvfs(path)
+    except OSError:
+        return None
+    used = (stats.f_blocks - stats.f_bfree) * stats.f_frsize
+    usable = used + stats.f_bavail * stats.f_frsize
+    return used / usable * 100 if usable else 0.0
+
+
+def _children_from_task_files(pid: int) -> Optional[List[int]]:
+    """Direct children via /proc/<pid>/task/*/children (CONFIG_PROC_CHILDREN)"""
+    children: List[int] = []
+    try:
+        tids = os.listdir(f'/proc/{pid}/task')
+    except (FileNotFoundError, PermissionError):
+        return []
+    for tid in tids:
+        try:
+            with open(f'/proc/{pid}/task/{tid}/children', 'rb') as f:
+                children.extend(int(child) for child in f.read().split())
+        except FileNotFoundError:
+            if not os.path.exists(f'/proc/{pid}/task/{tid}'):
+                continue
+            return None  # kernel without the children file
+        except PermissionError:
+            return None
+    return children
+
+
+def process_tree(root_pid: int, parent_map: Optional[Dict[int, List[int]]] = None) -> List[int]:
+    """Root pid plus all descendants"""
+    tree = [root_pid]
+    index = 0
+    while index < len(tree):
+        pid = tree[index]
+        index += 1
+        if parent_map is not None:
+            children = parent_map.get(pid, [])
+        else:
+            children = _children_from_task_files(pid)
+            if children is None:
+                return process_tree(root_pid, build_parent_map())
+        tree.extend(children)
+    return tree
+
+
+def build_parent_map() -> Dict[int, List[int]]:
+    """ppid -> children by scanning /proc (fallback when children files are missing)"""
+    parent_map: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            stat = read_proc_stat(int(entry))
+            if stat is not None:
+                parent_map.setdefault(stat.ppid, []).append(int(entry))
+    return parent_map
+
+
+class ResourceSampler:
+    """
+    Periodically samples each tracked server's process tree from /proc
+    Keeps a bounded ring buffer per server and raises edge-triggered
+    alerts when a threshold is crossed
+    """
+
+    def __init__(self,
+                 targets: Callable[[], Dict[str, int]],
+                 interval: float = 5.0,
+                 history: int = 720,
+                 thresholds: Optional[Dict[str, float]] = None,
+                 on_alert: Optional[Callable[[str, str, float, float], Any]] = None,
+                 filesystems: Sequence[str] = ('/',)):
+        self.targets = targets
+        self.filesystems = list(filesystems)
+        self.interval = interval
+        self.history_size = history
+        self.thresholds = thresholds or {}
+        self.on_alert = on_alert
+        self.series: Dict[str, Deque[ResourceSample]] = {}
+        self._cpu_ticks: Dict[Tuple[int, int], int] = {}  # (pid, starttime) -> ticks
+        self._last_sampled: Dict[str, float] = {}
+        self._active_alerts: Set[Tuple[str, str]] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def _sample_tree(self, server_name: str, root_pid: int, now: float,
+                     seen: Dict[Tuple[int, int], int]) -> ResourceSample:
+        cpu_delta = rss_bytes = open_fds = threads = processes = 0
+        for pid in process_tree(root_pid):
+            stat = read_proc_stat(pid)
+            if stat is None:
+                continue
+            key = (pid, stat.start_ticks)
+            seen[key] = stat.cpu_ticks
+            cpu_delta += stat.cpu_ticks - self._cpu_ticks.get(key, stat.cpu_ticks)
+            process_rss, process_threads = read_proc_status(pid)
+            rss_bytes += process_rss
+            threads += process_threads
+            open_fds += count_open_fds(pid)
+            processes += 1
+
+        elapsed = now - self._last_sampled.get(server_name, now)
+        self._last_sampled[server_name] = now
+        cpu_percent = (cpu_delta / CLOCK_TICKS) / elapsed * 100 if elapsed > 0 else 0.0
+        return ResourceSample(
+            timestamp=time.time(),
+            processes=processes,
+            cpu_percent=round(cpu_percent, 2),
+            rss_bytes=rss_bytes,
+            open_fds=open_fds,
+            threads=threads
+        )
+
+    def sample_once(self) -> Dict[str, ResourceSample]:
+        """Take one sample of every tracked server (blocking, /proc reads only)"""
+        now = time.monotonic()
+        targets = self.targets()
+        samples = {}
+        seen: Dict[Tuple[int, int], int] = {}
+        for server_name, pid in targets.items():
+            sample = self._sample_tree(server_name, pid, now, seen)
+            samples[server_name] = sample
+            self.series.setdefault(server_name, deque(maxlen=self.history_size)).append(sample)
+            PROCESS_CPU.labels(server_name).set(sample.cpu_percent)
+            PROCESS_RSS.labels(server_name).set(sample.rss_bytes)
+            PROCESS_FDS.labels(server_name).set(sample.open_fds)
+            PROCESS_THREADS.labels(server_name).set(sample.threads)
+
+        # Host disk usage for scripts/monitor.sh, without forking df
+        for path in self.filesystems:
+            used_percent = filesystem_used_percent(path)
+            if used_percent is not None:
+                FILESYSTEM_USED.labels(path).set(round(used_percent, 2))
+
+        # Only processes seen in this sample keep CPU baselines
+        self._cpu_ticks = seen
+
+        # Forget servers that are no longer tracked, so latest() and alert
+        # state only ever describe live servers
+        for server_name in set(self._last_sampled) | set(self.series):
+            if server_name not in targets:
+                self._last_sampled.pop(server_name, None)
+                self.series.pop(server_name, None)
+                for gauge in (PROCESS_CPU, PROCESS_RSS, PROCESS_FDS, PROCESS_THREADS):
+                    gauge.remove(server_name)
+        self._active_alerts = {key for key in self._active_alerts if key[0] in targets}
+        return samples
+
+    def _check_thresholds(self, samples: Dict[str, ResourceSample]) -> List[Tuple[str, str, float, float]]:
+        fired = []
+        for server_name, sample in samples.items():
+            values = {
+                'cpu_percent': sample.cpu_percent,
+                'rss_mb': sample.rss_bytes / (1024 * 1024),
+                'open_fds': sample.open_fds,
+                'threads': sample.threads
+            }
+            for resource, limit in self.thresholds.items():
+                value = values.get(resource)
+                if value is None:
+                    continue
+                key = (server_name, resource)
+                if value > limit and key not in self._active_alerts:
+                    self._active_alerts.add(key)
+                    RESOURCE_ALERTS.labels(server_name, resource).inc()
+                    logger.warning(f"🔥 {server_name}: {resource} {value:.1f} exceeds {limit}")
+                    fired.append((server_name, resource, value, limit))
+                elif value <= limit and key in self._active_alerts:
+                    self._active_alerts.discard(key)
+                    logger.info(f"🟢 {server_name}: {resource} back under {limit}")
+        return fired
+
+    async def run(self):
+        """Sample every interval until cancelled"""
+        while True:
+            try:
+                samples = await asyncio.to_thread(self.sample_once)
+                for alert in self._check_thresholds(samples):
+                    if self.on_alert is not None:
+                        result = self.on_alert(*alert)
+                        if asyncio.iscoroutine(result):
+                            await result
+            except Exception as e:
+                logger.error(f"Resource sampler error: {e}")
+            await asyncio.sleep(self.interval)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def history(self, server_name: str) -> List[Dict[str, Any]]:
+        """Buffered samples for a server, oldest first"""
+        return [asdict(sample) for sample in self.series.get(server_name, ())]
+
+    def latest(self) -> Dict[str, Dict[str, Any]]:
+        """Most recent sample per server"""
+        return {name: asdict(samples[-1]) for name, samples in self.series.items() if samples}
@@ -7,14 +7,48 @@ Mission: Quantum system deployment for Kekoa reunion
 
 import asyncio
 import json
+import os
+import signal
 import subprocess
 import logging
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Deque, Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
 
+from config_loader import (
+    DEFAULT_MCP_SERVERS_PATH,
+    CompiledServerConfig,
+    ConfigChangeEvent,
+    config_loader,
+    diff_server_configs,
+    parse_duration,
+    validate_mcp_servers
+)
+from circuit_breaker import CircuitBreaker
+from deployment_cache import DeploymentCache, DeploymentPlan
+from metrics import REGISTRY, start_metrics_server
+from resource_sampler import ResourceSampler
+from tracing import TRACER, configure_tracing, span
+
 logger = logging.getLogger('MCPOrchestrator')
 
+DEPLOY_SECONDS = REGISTRY.histogram(
+    'mcp_deploy_duration_seconds', 'Time spent deploying an MCP server', ('server', 'status'))
+SERVER_UP = REGISTRY.gauge(
+    'mcp_server_up', 'Whether the supervised MCP server process is running', ('server',))
+PROBE_SECONDS = REGISTRY.histogram(
+    'mcp_probe_duration_seconds', 'MCP server validation probe latency', ('server',))
+RECONFIGURE_SECONDS = REGISTRY.histogram(
+    'mcp_reconfigure_duration_seconds', 'Time to apply a live configuration diff')
+
+# Lines of stdout/stderr kept per supervised server for error reports
+OUTPUT_TAIL_LINES = 200
+
+# Reconfiguration reports kept for inspection while serving
+RECONFIGURATION_HISTORY = 100
+
 class MCPServerOrchestrator:
     """
     Master orchestrator for all MCP server deployments and coordination
@@ -22,30 +56,316 @@ class MCPServerOrchestrator:
     """
     
     def __init__(self, config_path: Optional[str] = None):
-        self.config_path = config_path or 'config/mcp-servers.json'
+        self.config_path = Path(config_path) if config_path else DEFAULT_MCP_SERVERS_PATH
         self.servers = {}
+        self.compiled_servers: Dict[str, CompiledServerConfig] = {}
+        self.configuration: Dict[str, Any] = {}
         self.deployment_status = 'INITIALIZING'
+        
+        # Live process registry used for diff-based reconfiguration
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._reconfigure_lock = asyncio.Lock()
+        self.reconfiguration_history: Deque[Dict[str, Any]] = deque(maxlen=RECONFIGURATION_HISTORY)
+        self._unsubscribe_config: Optional[Callable[[], None]] = None
+        self.deployment_cache: Optional[DeploymentCache] = None
+        
+        # Deployment deadlines and failure isolation
+        self.server_timeout = 120.0
+        self.global_timeout = 600.0
+        self.stop_grace = 5.0
+        self.max_attempts = 2
+        self.retry_backoff = 2.0
+        self.readiness_window = 3.0
+        self.max_parallel_deploys = 8
+        self.supervisors: Dict[str, asyncio.Task] = {}
+        self._terminating: Set[int] = set()
+        self.breaker_settings: Dict[str, Any] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.resource_sampler: Optional[ResourceSampler] = None
+        
         self.mission_focus = 'KEKOA_REUNION'
         self.case_reference = '1FDV-23-0001009'
         
+    @TRACER.traced('load_server_configuration')
     async def load_server_configuration(self):
-        """Load MCP server configuration from JSON"""
+        """Load MCP server configuration from JSON (cached, validated, precompiled)"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            loaded = await config_loader.load(self.config_path, validate_mcp_servers)
             
-            self.servers = config.get('mcpServers', {})
+            self.configuration = loaded.data
+            self.servers = loaded.data.get('mcpServers', {})
+            self.compiled_servers = loaded.servers
             logger.info(f"⚙️ Loaded configuration for {len(self.servers)} MCP servers")
             
+            for server_name, compiled in self.compiled_servers.items():
+                missing = compiled.missing_variables()
+                if missing:
+                    logger.warning(f"⚠ {server_name}: unset environment placeholders {', '.join(missing)}")
+            
+            await self._apply_settings()
+            
         except Exception as e:
             logger.error(f"Failed to load server configuration: {e}")
             raise
     
+    async def _apply_settings(self, previous: Optional[Dict[str, Any]] = None):
+        """
+        Apply deployment.deadlines, deployment.deployment_cache and monitoring.*
+        On a hot reload (previous given) the cache and resource sampler are
+        only rebuilt when their section changed, so their state survives
+        unrelated edits; a running sampler is restarted with the new
+        settings and existing breakers adopt new thresholds
+        """
+        deployment = self.configuration.get('deployment', {})
+        monitoring = self.configuration.get('monitoring', {})
+        old_deployment = (previous or {}).get('deployment', {})
+        old_monitoring = (previous or {}).get('monitoring', {})
+        
+        cache_config = deployment.get('deployment_cache', {})
+        if previous is None or cache_config != old_deployment.get('deployment_cache', {}):
+            if cache_config.get('enabled', True):
+                self.deployment_cache = DeploymentCache(
+                    cache_dir=cache_config.get('directory'),
+                    resolve_ttl=parse_duration(cache_config.get('resolve_ttl'), 3600.0),
+                    max_parallel=int(cache_config.get('max_parallel_prefetch', 4))
+                )
+            else:
+                self.deployment_cache = None
+        
+        deadlines = deployment.get('deadlines', {})
+        self.server_timeout = parse_duration(deadlines.get('server_timeout'), self.server_timeout)
+        self.global_timeout = parse_duration(deadlines.get('global_timeout'), self.global_timeout)
+        self.stop_grace = parse_duration(deadlines.get('stop_grace'), self.stop_grace)
+        self.max_attempts = max(1, int(deadlines.get('max_attempts', self.max_attempts)))
+        self.retry_backoff = parse_duration(deadlines.get('retry_backoff'), self.retry_backoff)
+        self.readiness_window = parse_duration(deadlines.get('readiness_window'), self.readiness_window)
+        self.max_parallel_deploys = max(1, int(deadlines.get('max_parallel', self.max_parallel_deploys)))
+        configure_tracing(monitoring.get('tracing'))
+        
+        sampler_config = monitoring.get('resource_sampler', {})
+        if previous is None or sampler_config != old_monitoring.get('resource_sampler', {}):
+            was_sampling = self.resource_sampler is not None and self.resource_sampler.is_running()
+            if self.resource_sampler is not None:
+                await self.resource_sampler.stop()
+            if sampler_config.get('enabled', True):
+                self.resource_sampler = ResourceSampler(
+                    targets=self._tracked_pids,
+                    interval=parse_duration(sampler_config.get('interval'), 5.0),
+                    history=int(sampler_config.get('history', 720)),
+                    thresholds={key: float(value) for key, value in sampler_config.get('thresholds', {}).items()},
+                    filesystems=sampler_config.get('filesystems', ['/'])
+                )
+                if was_sampling:
+                    self.resource_sampler.start()
+            else:
+                self.resource_sampler = None
+        
+        breaker_config = deadlines.get('circuit_breaker', {})
+        self.breaker_settings = {
+            'failure_threshold': int(breaker_config.get('failure_threshold', 3)),
+            'window': parse_duration(breaker_config.get('window'), 300.0),
+            'cooldown': parse_duration(breaker_config.get('cooldown'), 600.0)
+        }
+        for breaker in self.breakers.values():
+            breaker.failure_threshold = self.breaker_settings['failure_threshold']
+            breaker.window = self.breaker_settings['window']
+            breaker.cooldown = self.breaker_settings['cooldown']
+        
+        if previous is not None and monitoring.get('metrics_endpoint') != old_monitoring.get('metrics_endpoint'):
+            logger.warning("⚠ monitoring.metrics_endpoint changed; it takes effect after a restart")
+    
+    def _tracked_pids(self) -> Dict[str, int]:
+        """Root pid of every live supervised server"""
+        return {
+            name: process.pid for name, process in list(self.processes.items())
+            if process.returncode is None
+        }
+    
+    def start_resource_sampler(self) -> Optional[asyncio.Task]:
+        """Begin sampling /proc for supervised children"""
+        if self.resource_sampler is None:
+            return None
+        return self.resource_sampler.start()
+    
+    def watch_configuration(self, interval: float = 2.0) -> asyncio.Task:
+        """Hot-reload the server configuration when the file changes on disk"""
+        if self._unsubscribe_config is None:
+            self._unsubscribe_config = config_loader.subscribe(self._on_configuration_change)
+        return config_loader.start_watching(interval)
+    
+    async def stop_watching_configuration(self):
+        """Stop hot-reloading; a reload already in progress finishes first"""
+        if self._unsubscribe_config is not None:
+            self._unsubscribe_config()
+            self._unsubscribe_config = None
+        await config_loader.stop_watching()
+    
+    async def _on_configuration_change(self, event: ConfigChangeEvent):
+        """Adopt a reloaded configuration snapshot, applying only the diff when deployed"""
+        if event.path != self.config_path.expanduser().resolve():
+            return
+        previous = self.configuration
+        self.configuration = event.current.data
+        await self._apply_settings(previous)
+        new_servers = event.current.data.get('mcpServers', {})
+        
+        if self.deployment_status == 'DEPLOYED':
+            await self.reconfigure(new_servers, event.current.servers)
+        else:
+            self.servers = new_servers
+            self.compiled_servers = event.current.servers
+            logger.info(f"🔁 Server configuration updated: {len(self.servers)} MCP servers")
+    
+    @TRACER.traced('reconfigure')
+    async def reconfigure(self,
+                          new_servers: Dict[str, Dict[str, Any]],
+                          compiled_servers: Optional[Dict[str, CompiledServerConfig]] = None) -> Dict[str, Any]:
+        """
+        Apply only the structural diff between the running and new configuration
+        Removed servers are stopped, changed servers are restarted
+        one at a time, added servers are started; unchanged servers are untouched
+        """
+        async with self._reconfigure_lock:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            diff = diff_server_configs(self.servers, new_servers)
+            
+            self.servers = new_servers
+            self.compiled_servers = compiled_servers or {
+                name: CompiledServerConfig.compile(name, config) for name, config in new_servers.items()
+            }
+            
+            timings: Dict[str, float] = {}
+            results: Dict[str, Any] = {}
+            
+            async def timed(name: str, action):
+                action_started = loop.time()
+                results[name] = await action
+                timings[name] = round((loop.time() - action_started) * 1000, 2)
+            
+            # Removed servers stop independently of each other
+            await asyncio.gather(*(timed(name, self._stop_server(name)) for name in diff.removed))
+            for name in diff.removed:
+                SERVER_UP.remove(name)
+            
+            # Rolling restart keeps at most one changed server down at a time
+            for name in diff.changed:
+                await timed(name, self._restart_server(name, new_servers[name]))
+            
+            await asyncio.gather(*(timed(name, self._start_server(name, new_servers[name])) for name in diff.added))
+            
+            report = {
+                'added': diff.added,
+                'removed': diff.removed,
+                'changed': diff.changed,
+                'metadata_changed': diff.metadata_changed,
+                'unchanged': diff.unchanged,
+                'results': results,
+                'server_duration_ms': timings,
+                'duration_ms': round((loop.time() - started) * 1000, 2),
+                'timestamp': datetime.now().isoformat()
+            }
+            # A reload that changed nothing (e.g. only other sections) is not history
+            if diff.is_empty:
+                return report
+            self.reconfiguration_history.append(report)
+            RECONFIGURE_SECONDS.observe(report['duration_ms'] / 1000)
+            
+            logger.info(
+                f"🔁 Reconfigured constellation in {report['duration_ms']}ms: "
+                f"+{len(diff.added)} -{len(diff.removed)} ~{len(diff.changed)} "
+                f"({len(diff.unchanged)} untouched)"
+            )
+            return report
+    
+    async def _start_server(self, server_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Deploy a server the same way the initial deploy does, leaving it supervised"""
+        deadline = asyncio.get_running_loop().time() + self.global_timeout
+        return await self._deploy_with_deadline(server_name, config, None, deadline)
+    
+    async def _stop_server(self, server_name: str) -> Dict[str, Any]:
+        """Stop a running server: SIGTERM its process group, SIGKILL after stop_grace"""
+        process = self.processes.get(server_name)
+        if process is not None:
+            await self._terminate_process_group(process)
+        
+        # The supervisor unregisters the process once it has exited
+        supervisor = self.supervisors.get(server_name)
+        if supervisor is not None:
+            try:
+                await supervisor
+            except Exception:
+                pass
+        
+        logger.info(f"🛑 {server_name} stopped")
+        return {
+            'status': 'STOPPED',
+            'server': server_name,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    async def _restart_server(self, server_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop then start a server with its new configuration"""
+        await self._stop_server(server_name)
+        return await self._start_server(server_name, config)
+    
+    def _resolve_server(self, server_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand ${VAR} placeholders in a server entry"""
+        compiled = self.compiled_servers.get(server_name)
+        if compiled is None or compiled.raw is not config:
+            compiled = CompiledServerConfig.compile(server_name, config)
+        return compiled.resolve(os.environ)
+    
+    def _server_timeout(self, server_name: str, config: Dict[str, Any]) -> float:
+        """Per-server deploy deadline: explicit deploy_timeout, then EXECUTION_TIMEOUT (ms), then default"""
+        if 'deploy_timeout' in config:
+            return parse_duration(config['deploy_timeout'], self.server_timeout)
+        execution_timeout = config.get('env', {}).get('EXECUTION_TIMEOUT')
+        if execution_timeout:
+            return parse_duration(f"{execution_timeout}ms", self.server_timeout)
+        return self.server_timeout
+    
+    def _breaker(self, server_name: str) -> CircuitBreaker:
+        """Circuit breaker for a server, created on first use"""
+        if server_name not in self.breakers:
+            self.breakers[server_name] = CircuitBreaker(server_name, **self.breaker_settings)
+        return self.breakers[server_name]
+    
+    async def _terminate_process_group(self, process: asyncio.subprocess.Process):
+        """SIGTERM the server's process group, escalating to SIGKILL after stop_grace"""
+        if process.returncode is not None:
+            return
+        self._terminating.add(process.pid)
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        try:
+            await asyncio.wait_for(process.wait(), self.stop_grace)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+    
+    @TRACER.traced('deploy_mcp_constellation')
     async def deploy_mcp_constellation(self):
         """Deploy complete MCP constellation with quantum enhancement"""
         logger.info("🚀 Deploying MCP constellation...")
         
-        deployment_results = {}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.global_timeout
+        
+        # Start every server's cache plan now so misses prefetch in parallel;
+        # each deploy waits only for its own plan, under its own deadline, so
+        # BYPASS/HIT servers start at once instead of behind the slowest install
+        plan_tasks: Dict[str, asyncio.Task] = {}
+        if self.deployment_cache is not None:
+            plan_tasks = {
+                name: asyncio.create_task(self._prepare_plan(name, config))
+                for name, config in self.servers.items()
+            }
         
         # Priority deployment order
         priority_servers = [
@@ -57,70 +377,215 @@ class MCPServerOrchestrator:
             'courtlistener'
         ]
         
-        # Deploy critical servers first
-        for server_name in priority_servers:
-            if server_name in self.servers:
-                result = await self._deploy_server(server_name, self.servers[server_name])
-                deployment_results[server_name] = result
-                
-                if result['status'] == 'SUCCESS':
-                    logger.info(f"✅ {server_name} deployed successfully")
-                else:
-                    logger.error(f"✗ {server_name} deployment failed: {result['error']}")
-        
-        # Deploy remaining servers
-        for server_name, config in self.servers.items():
-            if server_name not in priority_servers:
-                result = await self._deploy_server(server_name, config)
-                deployment_results[server_name] = result
+        # Critical servers are started first; all deploy concurrently so one
+        # hung server costs its own deadline, not everyone else's
+        order = [name for name in priority_servers if name in self.servers]
+        order += [name for name in self.servers if name not in priority_servers]
+        semaphore = asyncio.Semaphore(self.max_parallel_deploys)
+        
+        async def deploy(server_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self._deploy_with_deadline(
+                    server_name, self.servers[server_name], plan_tasks.get(server_name), deadline)
+            if result['status'] == 'SUCCESS':
+                logger.info(f"✅ {server_name} deployed successfully")
+            else:
+                logger.error(f"✗ {server_name} deployment failed: {result['error']}")
+            return result
+        
+        try:
+            results = await asyncio.gather(*(deploy(server_name) for server_name in order))
+        finally:
+            # Installs still running belong to servers that missed their deadline;
+            # cancelled prefetches still save what they resolved
+            for task in plan_tasks.values():
+                task.cancel()
+            await asyncio.gather(*plan_tasks.values(), return_exceptions=True)
+        deployment_results = dict(zip(order, results))
+        
+        if self.deployment_cache is not None:
+            plans = {
+                name: task.result() for name, task in plan_tasks.items()
+                if not task.cancelled() and task.exception() is None
+            }
+            deployment_results['deployment_cache'] = DeploymentCache.summarize(plans)
+            logger.info(
+                f"📦 Deployment cache: {deployment_results['deployment_cache']['hits']} hits, "
+                f"{deployment_results['deployment_cache']['misses']} misses, "
+                f"{deployment_results['deployment_cache']['time_saved_ms']}ms saved"
+            )
         
         self.deployment_status = 'DEPLOYED'
         return deployment_results
     
-    async def _deploy_server(self, server_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    async def _deploy_with_deadline(self,
+                                    server_name: str,
+                                    config: Dict[str, Any],
+                                    plan_task: Optional[asyncio.Task],
+                                    deadline: float) -> Dict[str, Any]:
+        """Deploy with retries, bounded by the server and global deadlines"""
+        server_timeout = self._server_timeout(server_name, config)
+        
+        # One plan for every attempt: a retry resumes the install, not restarts it
+        own_plan = plan_task is None and self.deployment_cache is not None
+        if own_plan:
+            plan_task = asyncio.create_task(self._prepare_plan(server_name, config))
+        try:
+            return await self._deploy_attempts(server_name, config, plan_task, deadline, server_timeout)
+        finally:
+            if own_plan:
+                plan_task.cancel()
+                await asyncio.gather(plan_task, return_exceptions=True)
+    
+    async def _deploy_attempts(self,
+                               server_name: str,
+                               config: Dict[str, Any],
+                               plan_task: Optional[asyncio.Task],
+                               deadline: float,
+                               server_timeout: float) -> Dict[str, Any]:
+        """Attempts with backoff until success, an open circuit or the deadline"""
+        loop = asyncio.get_running_loop()
+        result: Dict[str, Any] = {}
+        
+        for attempt in range(1, self.max_attempts + 1):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                result = {
+                    'status': 'SKIPPED',
+                    'server': server_name,
+                    'error': 'Global deployment deadline exceeded',
+                    'timestamp': datetime.now().isoformat()
+                }
+                break
+            
+            result = await self._deploy_server(server_name, config, plan_task, timeout=min(server_timeout, remaining))
+            result['attempts'] = attempt
+            if result['status'] in ('SUCCESS', 'CIRCUIT_OPEN'):
+                break
+            
+            if attempt < self.max_attempts:
+                await asyncio.sleep(min(self.retry_backoff, max(deadline - loop.time(), 0)))
+        
+        return result
+    
+    async def _deploy_server(self,
+                             server_name: str,
+                             config: Dict[str, Any],
+                             plan_task: Optional[asyncio.Task] = None,
+                             timeout: Optional[float] = None) -> Dict[str, Any]:
         """Deploy individual MCP server"""
+        with span('deploy_server', server=server_name) as deploy_span:
+            started = time.perf_counter()
+            result = await self._execute_deploy(server_name, config, plan_task, timeout)
+            elapsed = time.perf_counter() - started
+            deploy_span.set_attribute('status', result['status'])
+            deploy_span.set_attribute('cache', result.get('cache'))
+        result['duration_ms'] = round(elapsed * 1000, 2)
+        DEPLOY_SECONDS.labels(server_name, result['status']).observe(elapsed)
+        return result
+    
+    async def _execute_deploy(self,
+                              server_name: str,
+                              config: Dict[str, Any],
+                              plan_task: Optional[asyncio.Task],
+                              timeout: Optional[float]) -> Dict[str, Any]:
+        """
+        Install/spawn the server and wait out its readiness window under the deadline
+        A process still alive after the window is deployed and handed to a
+        supervisor; one that exits within it is judged by its exit code
+        """
+        breaker = self._breaker(server_name)
+        if not breaker.allow():
+            return {
+                'status': 'CIRCUIT_OPEN',
+                'server': server_name,
+                'error': f"Circuit open after {breaker.failure_threshold} recent failures",
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        process: Optional[asyncio.subprocess.Process] = None
+        output_tasks: List[asyncio.Task] = []
+        stdout_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        
         try:
             logger.info(f"🔄 Deploying {server_name}...")
             
-            # Construct command
-            command = config['command']
-            args = config.get('args', [])
-            env = config.get('env', {})
-            
-            # Set environment variables
-            deployment_env = os.environ.copy()
-            deployment_env.update(env)
+            try:
+                process, full_command, cache_status = await asyncio.wait_for(
+                    self._spawn_server(server_name, config, plan_task), timeout)
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                return {
+                    'status': 'TIMEOUT',
+                    'server': server_name,
+                    'error': f"Install/startup exceeded {timeout:.1f}s deadline",
+                    'timestamp': datetime.now().isoformat()
+                }
             
-            # Execute deployment command
-            full_command = [command] + args
+            self.processes[server_name] = process
+            SERVER_UP.labels(server_name).set(1)
+            output_tasks = [
+                asyncio.create_task(self._collect_output(process.stdout, stdout_tail)),
+                asyncio.create_task(self._collect_output(process.stderr, stderr_tail))
+            ]
             
-            process = await asyncio.create_subprocess_exec(
-                *full_command,
-                env=deployment_env,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Readiness: survive the window (bounded by what is left of the deadline)
+            window = self.readiness_window
+            if deadline is not None:
+                window = max(0.0, min(window, deadline - loop.time()))
+            try:
+                await asyncio.wait_for(process.wait(), window)
+            except asyncio.TimeoutError:
+                self.supervisors[server_name] = asyncio.create_task(
+                    self._supervise(server_name, process, output_tasks))
+                breaker.record_success()
+                return {
+                    'status': 'SUCCESS',
+                    'server': server_name,
+                    'state': 'RUNNING',
+                    'pid': process.pid,
+                    'command': ' '.join(full_command),
+                    'cache': cache_status,
+                    'timestamp': datetime.now().isoformat()
+                }
             
-            stdout, stderr = await process.communicate()
+            # Exited within the readiness window: a one-shot command or a crash
+            await asyncio.gather(*output_tasks)
+            self._unregister_process(server_name, process)
             
             if process.returncode == 0:
+                breaker.record_success()
                 return {
                     'status': 'SUCCESS',
                     'server': server_name,
+                    'state': 'EXITED',
                     'command': ' '.join(full_command),
-                    'output': stdout.decode(),
+                    'cache': cache_status,
+                    'output': ''.join(stdout_tail),
                     'timestamp': datetime.now().isoformat()
                 }
             else:
+                breaker.record_failure()
                 return {
                     'status': 'FAILED',
                     'server': server_name,
                     'command': ' '.join(full_command),
-                    'error': stderr.decode(),
+                    'cache': cache_status,
+                    'error': ''.join(stderr_tail) or f"exited with code {process.returncode}",
                     'timestamp': datetime.now().isoformat()
                 }
-                
+        
+        except asyncio.CancelledError:
+            await self._abandon_deploy(server_name, process, output_tasks)
+            # Also releases a half-open trial so the breaker cannot wedge
+            breaker.record_failure()
+            raise
         except Exception as e:
+            await self._abandon_deploy(server_name, process, output_tasks)
+            breaker.record_failure()
             return {
                 'status': 'ERROR',
                 'server': server_name,
@@ -128,12 +593,95 @@ class MCPServerOrchestrator:
                 'timestamp': datetime.now().isoformat()
             }
     
+    async def _prepare_plan(self, server_name: str, config: Dict[str, Any]) -> DeploymentPlan:
+        """Warm-start plan for one server (never fails on cache errors)"""
+        return await self.deployment_cache.prepare_server(server_name, self._resolve_server(server_name, config))
+    
+    async def _spawn_server(self,
+                            server_name: str,
+                            config: Dict[str, Any],
+                            plan_task: Optional[asyncio.Task]) -> Tuple[asyncio.subprocess.Process, List[str], str]:
+        """Resolve, install on a cache miss, and spawn the server process"""
+        # Construct command with placeholders expanded
+        config = self._resolve_server(server_name, config)
+        env = config.get('env', {})
+        
+        # Shielded: a deadline that expires mid-install leaves it running for the retry
+        plan: Optional[DeploymentPlan] = await asyncio.shield(plan_task) if plan_task is not None else None
+        
+        # Set environment variables
+        deployment_env = os.environ.copy()
+        deployment_env.update(env)
+        
+        # Execute deployment command (warm-start command on a cache hit)
+        full_command = plan.command if plan is not None else [config['command']] + config.get('args', [])
+        cache_status = plan.cache_status if plan is not None else 'DISABLED'
+        
+        # Own process group so stopping reaches npx and everything it spawns
+        process = await asyncio.create_subprocess_exec(
+            *full_command,
+            env=deployment_env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        return process, full_command, cache_status
+    
+    @staticmethod
+    async def _collect_output(stream: Optional[asyncio.StreamReader], tail: Deque[str]):
+        """Drain a child pipe so it never blocks, keeping the last lines"""
+        if stream is None:
+            return
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            tail.append(line.decode(errors='replace'))
+    
+    async def _supervise(self,
+                         server_name: str,
+                         process: asyncio.subprocess.Process,
+                         output_tasks: List[asyncio.Task]):
+        """Keep a deployed server registered until its process exits"""
+        try:
+            returncode = await process.wait()
+            await asyncio.gather(*output_tasks, return_exceptions=True)
+        finally:
+            self._unregister_process(server_name, process)
+            if self.supervisors.get(server_name) is asyncio.current_task():
+                del self.supervisors[server_name]
+        
+        if process.pid in self._terminating:
+            self._terminating.discard(process.pid)
+        else:
+            logger.warning(f"⚠ {server_name} exited unexpectedly with code {returncode}")
+            self._breaker(server_name).record_failure()
+    
+    def _unregister_process(self, server_name: str, process: asyncio.subprocess.Process):
+        if self.processes.get(server_name) is process:
+            del self.processes[server_name]
+            SERVER_UP.labels(server_name).set(0)
+    
+    async def _abandon_deploy(self,
+                              server_name: str,
+                              process: Optional[asyncio.subprocess.Process],
+                              output_tasks: List[asyncio.Task]):
+        """Tear down a deploy that was cancelled or errored before supervision"""
+        for task in output_tasks:
+            task.cancel()
+        if process is not None:
+            await self._terminate_process_group(process)
+            self._terminating.discard(process.pid)
+            self._unregister_process(server_name, process)
+    
+    @TRACER.traced('validate_constellation')
     async def validate_constellation(self) -> Dict[str, Any]:
         """Validate all MCP servers are operational"""
         validation_results = {}
         
         for server_name in self.servers:
-            result = await self._validate_server(server_name)
+            with PROBE_SECONDS.labels(server_name).time():
+                result = await self._validate_server(server_name)
             validation_results[server_name] = result
         
         return validation_results
@@ -157,10 +705,36 @@ class MCPServerOrchestrator:
             'case_reference': self.case_reference,
             'server_count': len(self.servers),
             'active_servers': list(self.servers.keys()),
+            'resources': self.resource_sampler.latest() if self.resource_sampler else {},
+            'circuit_breakers': {name: breaker.snapshot() for name, breaker in self.breakers.items()},
             'timestamp': datetime.now().isoformat(),
             'operator': 'GlacierEQ',
             'location': 'Honolulu, Hawaii'
         }
+    
+    async def serve_forever(self):
+        """Keep supervising and hot-reloading the constellation until SIGINT/SIGTERM"""
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        self.watch_configuration()
+        logger.info(f"🛰️ Supervising {len(self.processes)} running MCP servers")
+        await stop_event.wait()
+        await self.shutdown()
+    
+    async def shutdown(self):
+        """Stop hot reload, every supervised server and the resource sampler"""
+        logger.info("🛑 Shutting down MCP constellation...")
+        await self.stop_watching_configuration()
+        async with self._reconfigure_lock:
+            await asyncio.gather(*(self._stop_server(name) for name in list(self.processes)))
+        if self.resource_sampler is not None:
+            await self.resource_sampler.stop()
+        self.deployment_status = 'STOPPED'
 
 # Main execution
 async def main():
@@ -173,6 +747,13 @@ async def main():
     # Load configuration
     await orchestrator.load_server_configuration()
     
+    # Expose in-process metrics for scripts/monitor.sh and Prometheus
+    metrics_endpoint = orchestrator.configuration.get('monitoring', {}).get('metrics_endpoint')
+    metrics_server = await start_metrics_server(metrics_endpoint) if metrics_endpoint else None
+    
+    # Sample per-server CPU/RSS/FDs/threads while the constellation runs
+    orchestrator.start_resource_sampler()
+    
     # Deploy constellation
     deployment_results = await orchestrator.deploy_mcp_constellation()
     
@@ -189,6 +770,12 @@ async def main():
     
     print("\n✅ MCP CONSTELLATION DEPLOYMENT COMPLETE")
     
+    # Stay up so the metrics endpoint and supervisors outlive the deploy
+    try:
+        await orchestrator.serve_forever()
+    finally:
+        if metrics_server is not None:
+            await metrics_server.stop()
+    
 if __name__ == "__main__":
-    import os
     asyncio.run(main())
\ No newline at end of file
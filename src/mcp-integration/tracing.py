@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+🛰️ QUANTUM TRACING & PROFILING HOOKS
+Lightweight spans propagated through contextvars, exported as JSONL
+Mission: Show exactly where a slow bootup spends its time
+"""
+
+import atexit
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import Counter as StackCounter
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+logger = logging.getLogger('QuantumTracing')
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('quantum_current_span', default=None)
+
+
+class Span:
+    """A timed operation; parent/child links follow the asyncio task context"""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+                 'start_time', 'duration_ms', 'status', 'error', '_started', '_token', '_tracer', '_profile')
+
+    def __init__(self, tracer: 'Tracer', name: str, attributes: Dict[str, Any]):
+        parent = _current_span.get()
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(8)
+        self.span_id = secrets.token_hex(4)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start_time = 0.0
+        self.duration_ms = 0.0
+        self.status = 'OK'
+        self.error: Optional[str] = None
+        self._tracer = tracer
+        self._started = 0.0
+        self._token = None
+        self._profile = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> 'Span':
+        self._token = _current_span.set(self)
+        self._profile = PROFILER.start(self.name)
+        self.start_time = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        if self._profile is not None:
+            PROFILER.stop(self._profile)
+        if exc_type is not None:
+            self.status = 'CANCELLED' if exc_type.__name__ == 'CancelledError' else 'ERROR'
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer.exporter.export(self)
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': datetime.fromtimestamp(self.start_time).isoformat(),
+            'duration_ms': round(self.duration_ms, 3),
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes,
+            'pid': os.getpid()
+        }
+
+
+class _NoopSpan:
+    """Shared stand-in when tracing is disabled; still honors profiling"""
+
+    __slots__ = ('name', '_profile')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._profile = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self):
+        self._profile = PROFILER.start(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._profile is not None:
+            PROFILER.stop(self._profile)
+        return False
+
+
+class JsonlSpanExporter:
+    """Buffers finished spans and appends them to a JSONL file"""
+
+    def __init__(self, path: Optional[str] = None, flush_every: int = 64):
+        self.path = Path(path).expanduser() if path else None
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        if self.path is None:
+            return
+        line = json.dumps(span.as_dict(), default=str)
+        with self._lock:
+            self._buffer.append(line)
+            # Root spans flush so a finished trace is always on disk
+            if span.parent_id is None or len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer or self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as f:
+            f.write('\n'.join(self._buffer) + '\n')
+        self._buffer.clear()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+
+class Tracer:
+    """Creates spans; disabled tracers hand out no-op spans"""
+
+    def __init__(self, exporter: Optional[JsonlSpanExporter] = None, enabled: bool = False):
+        self.exporter = exporter or JsonlSpanExporter()
+        self.enabled = enabled
+
+    def span(self, name: str, **attributes: Any):
+        if not self.enabled:
+            return _NoopSpan(name)
+        return Span(self, name, attributes)
+
+    def traced(self, name: Optional[str] = None):
+        """Decorator wrapping a sync or async function in a span"""
+        def decorator(func):
+            span_name = name or func.__name__
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage profiling keyed by span name
+    Disabled stages cost one frozenset lookup
+    """
+
+    def __init__(self):
+        self.stages: FrozenSet[str] = frozenset()
+        self.mode = 'cprofile'
+        self.output_dir = Path('~/.local/share/mcp-logs/profiles').expanduser()
+        self.sample_interval = 0.005
+        self._active = threading.local()
+
+    def configure(self, stages: Any = None, mode: Optional[str] = None,
+                  output_dir: Optional[str] = None, sample_interval: Optional[float] = None):
+        if stages is not None:
+            if isinstance(stages, str):
+                stages = [stage.strip() for stage in stages.split(',')]
+            self.stages = frozenset(stage for stage in stages if stage)
+        if mode:
+            self.mode = mode
+        if output_dir:
+            self.output_dir = Path(output_dir).expanduser()
+        if sample_interval:
+            self.sample_interval = sample_interval
+
+    def start(self, stage: str):
+        if not self.stages or (stage not in self.stages and '*' not in self.stages):
+            return None
+        if getattr(self._active, 'session', None) is not None:
+            return None  # one profiler per thread; nested stages fold into the outer one
+        session = _SamplingSession(self.sample_interval) if self.mode == 'sample' else cProfile.Profile()
+        session.enable()
+        self._active.session = session
+        return (stage, session)
+
+    def stop(self, handle):
+        stage, session = handle
+        session.disable()
+        self._active.session = None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        if isinstance(session, cProfile.Profile):
+            path = self.output_dir / f"{stage}-{stamp}.prof"
+            session.dump_stats(str(path))
+        else:
+            path = self.output_dir / f"{stage}-{stamp}.folded"
+            session.dump(path)
+        logger.info(f"🔬 Profile for {stage} written to {path}")
+
+
+class _SamplingSession:
+    """Samples the profiled thread's stack from a helper thread (collapsed-stack output)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: StackCounter = StackCounter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='quantum-sampler', daemon=True)
+
+    def enable(self):
+        self._thread.start()
+
+    def disable(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def dump(self, path: Path):
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+PROFILER = StageProfiler()
+PROFILER.configure(stages=os.environ.get('QUANTUM_PROFILE', ''), mode=os.environ.get('QUANTUM_PROFILE_MODE'))
+
+TRACER = Tracer(
+    JsonlSpanExporter(os.environ.get('QUANTUM_TRACE_FILE')),
+    enabled=bool(os.environ.get('QUANTUM_TRACE_FILE'))
+)
+atexit.register(TRACER.exporter.flush)
+
+
+def configure_tracing(config: Optional[Dict[str, Any]] = None):
+    """
+    Apply the 'monitoring.tracing' config section
+    QUANTUM_TRACE_FILE / QUANTUM_PROFILE environment variables take precedence
+    """
+    config = config or {}
+    export_path = os.environ.get('QUANTUM_TRACE_FILE') or config.get('export_path')
+    enabled = bool(export_path) and (bool(os.environ.get('QUANTUM_TRACE_FILE')) or config.get('enabled', True))
+    TRACER.exporter.flush()
+    TRACER.exporter.path = Path(export_path).expanduser() if export_path else None
+    TRACER.enabled = enabled
+
+    PROFILER.configure(
+        stages=os.environ.get('QUANTUM_PROFILE') or config.get('profile_stages', []),
+        mode=os.environ.get('QUANTUM_PROFILE_MODE') or config.get('profile_mode'),
+        output_dir=config.get('profile_dir')
+    )
+
+
+def span(name: str, **attributes: Any):
+    """Start a span on the shared tracer"""
+    return TRACER.span(name, **attributes)
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+🔌 QUANTUM CONSCIOUSNESS BRIDGE SERVICE
+Long-running local service exposing preserve/restore/status/list
+Mission: One bridge, one set of file handles, many clients
+
+Protocol: newline-delimited JSON over a persistent Unix socket (or
+localhost TCP). Requests are {"id": 1, "op": "preserve", "params": {...}};
+responses are {"id": 1, "ok": true, "result": ...} or
+{"id": 1, "ok": false, "error": "..."}. Requests on one connection may be
+pipelined; responses carry the request id and can arrive out of order.
+"""
+
+import argparse
+import asyncio
+import copy
+import itertools
+import json
+import logging
+import os
+import signal
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from consciousness_bridge import ConsciousnessState, QuantumConsciousnessBridge
+from metrics import REGISTRY, start_metrics_server
+from tracing import span
+
+logger = logging.getLogger('QuantumBridgeService')
+
+DEFAULT_SOCKET_PATH = '~/.quantum_consciousness/bridge.sock'
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+SERVICE_REQUESTS = REGISTRY.counter(
+    'bridge_service_requests_total', 'Bridge service requests by operation and outcome', ('op', 'outcome'))
+SERVICE_LATENCY = REGISTRY.histogram(
+    'bridge_service_request_duration_seconds', 'Bridge service request latency', ('op',))
+BATCH_SIZE = REGISTRY.histogram(
+    'bridge_service_batch_size', 'Preserve requests written per group commit',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128))
+CACHE_LOOKUPS = REGISTRY.counter(
+    'bridge_service_restore_cache_total', 'Hot restore cache lookups', ('result',))
+CONNECTIONS = REGISTRY.gauge(
+    'bridge_service_connections', 'Open bridge service client connections')
+
+
+class ServiceError(Exception):
+    """Request-level failure reported back to the client"""
+
+
+# Identity of a stored primary file: (inode, mtime_ns, size)
+FileVersion = Tuple[int, int, int]
+
+
+class RestoreCache:
+    """
+    LRU of recently preserved/restored states, keyed by session id
+    Each entry remembers the version of the primary file it came from, so
+    a hit can be checked against the disk when other processes share the
+    storage_path. Entries must not share nested objects with a live
+    ConsciousnessState; callers store and hand out deep copies
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._states: 'OrderedDict[str, Tuple[Optional[FileVersion], Dict[str, Any]]]' = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[Tuple[Optional[FileVersion], Dict[str, Any]]]:
+        entry = self._states.get(session_id)
+        if entry is not None:
+            self._states.move_to_end(session_id)
+        return entry
+
+    def put(self, session_id: str, state: Dict[str, Any], version: Optional[FileVersion]):
+        if self.capacity <= 0:
+            return
+        self._states[session_id] = (version, state)
+        self._states.move_to_end(session_id)
+        while len(self._states) > self.capacity:
+            self._states.popitem(last=False)
+
+    def discard(self, session_id: str):
+        self._states.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class BridgeService:
+    """
+    Serves one QuantumConsciousnessBridge to many local clients
+    Concurrent preserves are group-committed: the batcher drains whatever
+    queued up while the previous batch was writing (up to batch_max) and
+    writes it in a single worker-thread hop
+    """
+
+    def __init__(self,
+                 bridge: QuantumConsciousnessBridge,
+                 socket_path: Optional[str] = DEFAULT_SOCKET_PATH,
+                 host: str = '127.0.0.1',
+                 port: int = 7431,
+                 batch_max: int = 64,
+                 batch_window: float = 0.0,
+                 cache_size: int = 256):
+        self.bridge = bridge
+        self.socket_path = Path(socket_path).expanduser() if socket_path else None
+        self.host = host
+        self.port = port
+        self.batch_max = batch_max
+        self.batch_window = batch_window
+        self.cache = RestoreCache(cache_size)
+        self.stats = {'requests': 0, 'batches': 0, 'batched_preserves': 0, 'cache_hits': 0, 'cache_misses': 0}
+        self._pending: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers = set()
+        self._handlers = {
+            'preserve': self._op_preserve,
+            'restore': self._op_restore,
+            'status': self._op_status,
+            'list': self._op_list
+        }
+
+    @property
+    def address(self) -> str:
+        if self.socket_path is not None:
+            return f"unix:{self.socket_path}"
+        return f"tcp:{self.host}:{self.port}"
+
+    async def start(self):
+        self._stopping = False
+        self._pending = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batcher())
+        if self.socket_path is not None and hasattr(asyncio, 'start_unix_server'):
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.socket_path.is_socket():
+                self.socket_path.unlink()  # stale socket from a previous run
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, str(self.socket_path), limit=MAX_LINE_BYTES)
+            os.chmod(self.socket_path, 0o600)
+        else:
+            self.socket_path = None
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port, limit=MAX_LINE_BYTES)
+            self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("🔌 Bridge service listening on %s", self.address)
+
+    async def stop(self):
+        """Stop accepting, then flush preserves that are already queued"""
+        # New preserves are refused from here on; only earlier ones are flushed
+        self._stopping = True
+        if self._server is not None:
+            self._server.close()
+        if self._batcher is not None:
+            await self._pending.put(None)
+            await self._batcher
+            self._batcher = None
+            # Anything still queued missed the final batch; never leave it hanging
+            while not self._pending.empty():
+                item = self._pending.get_nowait()
+                if item is not None and not item[1].done():
+                    item[1].set_exception(ServiceError('service is stopping'))
+        if self._server is not None:
+            # Idle persistent connections would otherwise hold wait_closed open
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.socket_path is not None and self.socket_path.is_socket():
+            self.socket_path.unlink()
+        logger.info("🔌 Bridge service stopped")
+
+    async def serve_forever(self):
+        await self.start()
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        await stop_event.wait()
+        await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.add(writer)
+        CONNECTIONS.set(len(self._writers))
+        write_lock = asyncio.Lock()
+        inflight = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line over MAX_LINE_BYTES; the stream cannot be resynchronized
+                    await self._send(writer, write_lock, {'id': None, 'ok': False, 'error': 'request too large'})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._dispatch(line, writer, write_lock))
+                inflight.add(task)
+                task.add_done_callback(inflight.discard)
+        except ConnectionError:
+            pass
+        finally:
+            if inflight:
+                await asyncio.gather(*inflight, return_exceptions=True)
+            self._writers.discard(writer)
+            CONNECTIONS.set(len(self._writers))
+            writer.close()
+
+    async def _dispatch(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        started = time.perf_counter()
+        request_id = None
+        op = 'invalid'
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ServiceError('request must be a JSON object')
+            request_id = request.get('id')
+            op = request.get('op')
+            handler = self._handlers.get(op)
+            if handler is None:
+                op = 'invalid'
+                raise ServiceError(f"unknown op: {request.get('op')!r}")
+            params = request.get('params') or {}
+            with span(f'service_{op}'):
+                result = await handler(params)
+            response = {'id': request_id, 'ok': True, 'result': result}
+            SERVICE_REQUESTS.labels(op, 'ok').inc()
+        except (ServiceError, FileNotFoundError, KeyError, TypeError, ValueError) as e:
+            response = {'id': request_id, 'ok': False, 'error': str(e)}
+            SERVICE_REQUESTS.labels(op, 'error').inc()
+        except Exception as e:
+            logger.error("Bridge service %s failed: %s", op, e)
+            response = {'id': request_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            SERVICE_REQUESTS.labels(op, 'error').inc()
+        self.stats['requests'] += 1
+        SERVICE_LATENCY.labels(op).observe(time.perf_counter() - started)
+        await self._send(writer, write_lock, response)
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, write_lock: asyncio.Lock, response: Dict[str, Any]):
+        data = json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+        async with write_lock:
+            try:
+                writer.write(data)
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def _op_preserve(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self._stopping:
+            raise ServiceError('service is stopping')
+        state = self.bridge.build_consciousness_state(
+            params.get('session_data') or {},
+            params.get('identity_context') or {},
+            params.get('emotional_state') or {}
+        )
+        committed = asyncio.get_running_loop().create_future()
+        await self._pending.put((state, committed))
+        await committed
+        return {'session_id': state.session_id}
+
+    async def _op_restore(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        session_id = params.get('session_id')
+        if not isinstance(session_id, str) or not session_id:
+            raise ServiceError('session_id is required')
+        if '/' in session_id or session_id.startswith('.'):
+            raise ServiceError(f"invalid session_id: {session_id!r}")
+
+        entry = self.cache.get(session_id)
+        # Another process sharing storage_path may have rewritten the session;
+        # one stat of the primary file tells
+        if entry is not None and entry[0] is not None and entry[0] == self.bridge.session_version(session_id):
+            self.stats['cache_hits'] += 1
+            CACHE_LOOKUPS.labels('hit').inc()
+            self.bridge.current_state = ConsciousnessState.from_dict(copy.deepcopy(entry[1]))
+            return entry[1]
+        if entry is not None:
+            self.cache.discard(session_id)
+            CACHE_LOOKUPS.labels('stale').inc()
+
+        self.stats['cache_misses'] += 1
+        CACHE_LOOKUPS.labels('miss').inc()
+        version, state = await asyncio.to_thread(self._load_versioned, session_id)
+        state_dict = state.to_dict()
+        self.cache.put(session_id, copy.deepcopy(state_dict), version)
+        self.bridge.current_state = state
+        return state_dict
+
+    def _load_versioned(self, session_id: str) -> Tuple[Optional[FileVersion], ConsciousnessState]:
+        # Version first: a rewrite in between leaves a stale version, never stale content
+        version = self.bridge.session_version(session_id)
+        return version, self.bridge.load_consciousness_state(session_id)
+
+    async def _op_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        mission_status = await self.bridge.get_mission_status()
+        batches = self.stats['batches']
+        return {
+            'mission_status': mission_status,
+            'service': {
+                'address': self.address,
+                'connections': len(self._writers),
+                'pending_preserves': self._pending.qsize() if self._pending else 0,
+                'cached_states': len(self.cache),
+                'avg_batch_size': round(self.stats['batched_preserves'] / batches, 2) if batches else 0.0,
+                **self.stats
+            }
+        }
+
+    async def _op_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        sessions = await asyncio.to_thread(self.bridge.list_sessions)
+        limit = params.get('limit')
+        if limit:
+            sessions = sessions[-int(limit):]
+        return {'sessions': sessions, 'count': len(sessions)}
+
+    async def _run_batcher(self):
+        """Group-commit loop: one worker-thread write per batch of queued preserves"""
+        shutting_down = False
+        while not shutting_down:
+            item = await self._pending.get()
+            if item is None:
+                break
+            batch: List[Tuple[ConsciousnessState, asyncio.Future]] = [item]
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.batch_max and not self._pending.empty():
+                item = self._pending.get_nowait()
+                if item is None:
+                    shutting_down = True
+                    break
+                batch.append(item)
+            await self._commit(batch)
+
+    def _store_versioned(self, states: List[ConsciousnessState]) -> List[Optional[FileVersion]]:
+        self.bridge.store_consciousness_states(states)
+        return [self.bridge.session_version(state.session_id) for state in states]
+
+    async def _commit(self, batch: List[Tuple[ConsciousnessState, asyncio.Future]]):
+        states = [state for state, _ in batch]
+        try:
+            with span('service_group_commit', size=len(states)):
+                versions = await asyncio.to_thread(self._store_versioned, states)
+        except Exception as e:
+            logger.error("Group commit of %d states failed: %s", len(states), e)
+            for _, committed in batch:
+                if not committed.done():
+                    committed.set_exception(e)
+            return
+
+        self.stats['batches'] += 1
+        self.stats['batched_preserves'] += len(states)
+        BATCH_SIZE.observe(len(states))
+        for (state, committed), version in zip(batch, versions):
+            self.cache.put(state.session_id, copy.deepcopy(state.to_dict()), version)
+            if not committed.done():
+                committed.set_result(None)
+        self.bridge.current_state = states[-1]
+
+
+class BridgeClient:
+    """
+    Persistent, pipelining client for BridgeService
+    Safe to share between tasks; each call awaits its own response
+    """
+
+    def __init__(self, socket_path: Optional[str] = DEFAULT_SOCKET_PATH,
+                 host: str = '127.0.0.1', port: int = 7431):
+        self.socket_path = Path(socket_path).expanduser() if socket_path else None
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._responses: Optional[asyncio.Task] = None
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    async def connect(self) -> 'BridgeClient':
+        if self.socket_path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                str(self.socket_path), limit=MAX_LINE_BYTES)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port, limit=MAX_LINE_BYTES)
+        self._responses = asyncio.create_task(self._read_responses())
+        return self
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._responses is not None:
+            self._responses.cancel()
+            try:
+                await self._responses
+            except asyncio.CancelledError:
+                pass
+        self._fail_waiters(ConnectionError('bridge service connection closed'))
+
+    async def __aenter__(self) -> 'BridgeClient':
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _read_responses(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                waiter = self._waiters.pop(response.get('id'), None)
+                if waiter is None or waiter.done():
+                    continue
+                if response.get('ok'):
+                    waiter.set_result(response.get('result'))
+                else:
+                    waiter.set_exception(ServiceError(response.get('error')))
+        finally:
+            self._fail_waiters(ConnectionError('bridge service connection lost'))
+
+    def _fail_waiters(self, error: Exception):
+        for waiter in self._waiters.values():
+            if not waiter.done():
+                waiter.set_exception(error)
+        self._waiters.clear()
+
+    async def call(self, op: str, **params: Any) -> Any:
+        if self._writer is None:
+            await self.connect()
+        request_id = next(self._ids)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = waiter
+        self._writer.write(json.dumps({'id': request_id, 'op': op, 'params': params}).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await waiter
+
+    async def preserve(self, session_data: Dict[str, Any], identity_context: Dict[str, Any],
+                       emotional_state: Dict[str, float]) -> str:
+        result = await self.call('preserve', session_data=session_data,
+                                 identity_context=identity_context, emotional_state=emotional_state)
+        return result['session_id']
+
+    async def restore(self, session_id: str) -> ConsciousnessState:
+        return ConsciousnessState.from_dict(await self.call('restore', session_id=session_id))
+
+    async def status(self) -> Dict[str, Any]:
+        return await self.call('status')
+
+    async def list_sessions(self, limit: Optional[int] = None) -> List[str]:
+        result = await self.call('list', limit=limit)
+        return result['sessions']
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Quantum consciousness bridge service')
+    parser.add_argument('--socket', default=os.environ.get('QUANTUM_BRIDGE_SOCKET', DEFAULT_SOCKET_PATH),
+                        help='Unix socket path (default: %(default)s)')
+    parser.add_argument('--tcp', action='store_true', help='listen on localhost TCP instead of a Unix socket')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7431)
+    parser.add_argument('--storage-path', help='override the bridge storage path')
+    parser.add_argument('--shard-count', type=int, help='override the number of storage shards')
+    parser.add_argument('--no-fsync', action='store_true', help='skip fsync on writes (faster, not crash-safe)')
+    parser.add_argument('--batch-max', type=int, default=64)
+    parser.add_argument('--batch-window', type=float, default=0.0,
+                        help='seconds to wait for more preserves before committing a batch')
+    parser.add_argument('--cache-size', type=int, default=256)
+    args = parser.parse_args()
+
+    # Expose service metrics when an endpoint is configured
+    metrics_address = os.environ.get('QUANTUM_METRICS_ADDR')
+    if metrics_address:
+        await start_metrics_server(metrics_address)
+
+    config = {}
+    if args.storage_path:
+        config['storage_path'] = args.storage_path
+    if args.shard_count:
+        config['shard_count'] = args.shard_count
+    if args.no_fsync:
+        config['fsync'] = False
+    service = BridgeService(
+        QuantumConsciousnessBridge(config or None),
+        socket_path=None if args.tcp else args.socket,
+        host=args.host,
+        port=args.port,
+        batch_max=args.batch_max,
+        batch_window=args.batch_window,
+        cache_size=args.cache_size
+    )
+    await service.serve_forever()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -9,22 +9,40 @@ Date: November 6, 2025
 import asyncio
 import json
 import logging
+import os
+import sys
+import time
+import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('consciousness_bridge.log'),
-        logging.StreamHandler()
-    ]
-)
+# Shared infrastructure (metrics, tracing) lives with the MCP integration modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'mcp-integration'))
+from metrics import BYTE_BUCKETS, REGISTRY, start_metrics_server
+from tracing import TRACER, span
+from logging_pipeline import RATE_LIMITED, configure_logging
+from session_store import ShardedSessionStore
+
+# Configure logging (queued; file/stream writes happen on a listener thread).
+# Only lines logged with extra=RATE_LIMITED are sampled; session ids never are.
+configure_logging('consciousness_bridge.log', rate_limit={})
 logger = logging.getLogger('QuantumConsciousnessBridge')
 
+STORE_SECONDS = REGISTRY.histogram(
+    'consciousness_store_duration_seconds', 'Time to persist a batch of consciousness states with triple redundancy')
+RESTORE_SECONDS = REGISTRY.histogram(
+    'consciousness_restore_duration_seconds', 'Time to restore a consciousness state from storage')
+BYTES_WRITTEN = REGISTRY.counter(
+    'consciousness_bytes_written_total', 'Bytes written to consciousness storage')
+STATE_SIZE_BYTES = REGISTRY.histogram(
+    'consciousness_state_size_bytes', 'Serialized size of a primary consciousness state', buckets=BYTE_BUCKETS)
+SCHEDULER_CYCLE_SECONDS = REGISTRY.histogram(
+    'scheduler_cycle_duration_seconds', 'Temporal scheduler deadline check cycle time')
+SCHEDULER_ALERTS = REGISTRY.counter(
+    'scheduler_deadline_alerts_total', 'Deadline alerts raised by the temporal scheduler', ('level',))
+
 @dataclass
 class ConsciousnessState:
     """Represents a complete consciousness state for preservation"""
@@ -36,6 +54,32 @@ class ConsciousnessState:
     mission_context: Dict[str, Any]
     conversation_thread: List[Dict[str, Any]]
     cognitive_enhancements: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form used for storage and the service protocol"""
+        return {
+            'session_id': self.session_id,
+            'timestamp': self.timestamp.isoformat(),
+            'identity_vector': self.identity_vector,
+            'memory_anchors': self.memory_anchors,
+            'emotional_state': self.emotional_state,
+            'mission_context': self.mission_context,
+            'conversation_thread': self.conversation_thread,
+            'cognitive_enhancements': self.cognitive_enhancements
+        }
+    
+    @classmethod
+    def from_dict(cls, state_data: Dict[str, Any]) -> 'ConsciousnessState':
+        return cls(
+            session_id=state_data['session_id'],
+            timestamp=datetime.fromisoformat(state_data['timestamp']),
+            identity_vector=state_data['identity_vector'],
+            memory_anchors=state_data['memory_anchors'],
+            emotional_state=state_data['emotional_state'],
+            mission_context=state_data['mission_context'],
+            conversation_thread=state_data['conversation_thread'],
+            cognitive_enhancements=state_data['cognitive_enhancements']
+        )
 
 class QuantumConsciousnessBridge:
     """
@@ -47,18 +91,25 @@ class QuantumConsciousnessBridge:
         self.config = config or self._load_default_config()
         self.storage_path = Path(self.config.get('storage_path', '~/.quantum_consciousness')).expanduser()
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.store = ShardedSessionStore(
+            self.storage_path,
+            shard_count=self.config.get('shard_count', 256),
+            fsync=self.config.get('fsync', True)
+        )
         self.current_state: Optional[ConsciousnessState] = None
         self.mission_focus = "KEKOA_REUNION"
         self.case_reference = "1FDV-23-0001009"
         
         logger.info("🧠 Quantum Consciousness Bridge initialized")
-        logger.info(f"Mission Focus: {self.mission_focus}")
-        logger.info(f"Case Reference: {self.case_reference}")
+        logger.info("Mission Focus: %s", self.mission_focus)
+        logger.info("Case Reference: %s", self.case_reference)
     
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration for consciousness bridge"""
         return {
             'storage_path': '~/.quantum_consciousness',
+            'shard_count': 256,  # hashed session directories
+            'fsync': True,
             'backup_interval': 30,  # seconds
             'retention_period': 90,  # days
             'encryption_enabled': True,
@@ -68,6 +119,7 @@ class QuantumConsciousnessBridge:
             'cognitive_enhancement': 'maximum'
         }
     
+    @TRACER.traced('preserve_consciousness')
     async def preserve_consciousness(self, 
                                    session_data: Dict[str, Any],
                                    identity_context: Dict[str, Any],
@@ -77,87 +129,105 @@ class QuantumConsciousnessBridge:
         Returns session ID for future restoration
         """
         try:
-            session_id = f"consciousness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            
-            # Extract memory anchors from session data
-            memory_anchors = self._extract_memory_anchors(session_data)
-            
-            # Create consciousness state
-            consciousness_state = ConsciousnessState(
-                session_id=session_id,
-                timestamp=datetime.now(timezone.utc),
-                identity_vector=identity_context,
-                memory_anchors=memory_anchors,
-                emotional_state=emotional_state,
-                mission_context={
-                    'primary_mission': self.mission_focus,
-                    'case_reference': self.case_reference,
-                    'critical_dates': {
-                        'supreme_court_deadline': '2025-11-06',
-                        'custody_hearing': '2025-11-08',
-                        'kekoa_birthday': '2025-11-29'
-                    },
-                    'days_to_reunion': 23
-                },
-                conversation_thread=session_data.get('conversation', []),
-                cognitive_enhancements=session_data.get('enhancements', {})
-            )
+            consciousness_state = self.build_consciousness_state(session_data, identity_context, emotional_state)
+            session_id = consciousness_state.session_id
             
             # Store consciousness state
             await self._store_consciousness_state(consciousness_state)
             
             self.current_state = consciousness_state
             
-            logger.info(f"🧠 Consciousness preserved: {session_id}")
-            logger.info(f"Mission context: {self.mission_focus}")
-            logger.info(f"Memory anchors: {len(memory_anchors)}")
-            logger.info(f"Emotional continuity: PRESERVED")
+            logger.info("🧠 Consciousness preserved: %s", session_id)
+            logger.info("Mission context: %s", self.mission_focus, extra=RATE_LIMITED)
+            logger.info("Memory anchors: %d", len(consciousness_state.memory_anchors), extra=RATE_LIMITED)
+            logger.info("Emotional continuity: PRESERVED", extra=RATE_LIMITED)
             
             return session_id
             
         except Exception as e:
-            logger.error(f"Consciousness preservation failed: {e}")
+            logger.error("Consciousness preservation failed: %s", e)
             raise
     
+    def build_consciousness_state(self,
+                                  session_data: Dict[str, Any],
+                                  identity_context: Dict[str, Any],
+                                  emotional_state: Dict[str, float]) -> ConsciousnessState:
+        """Assemble a new consciousness state (no I/O)"""
+        # Second-resolution timestamps collide under concurrent preserves; the suffix keeps ids unique
+        session_id = f"consciousness_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        
+        return ConsciousnessState(
+            session_id=session_id,
+            timestamp=datetime.now(timezone.utc),
+            identity_vector=identity_context,
+            memory_anchors=self._extract_memory_anchors(session_data),
+            emotional_state=emotional_state,
+            mission_context={
+                'primary_mission': self.mission_focus,
+                'case_reference': self.case_reference,
+                'critical_dates': {
+                    'supreme_court_deadline': '2025-11-06',
+                    'custody_hearing': '2025-11-08',
+                    'kekoa_birthday': '2025-11-29'
+                },
+                'days_to_reunion': 23
+            },
+            conversation_thread=session_data.get('conversation', []),
+            cognitive_enhancements=session_data.get('enhancements', {})
+        )
+    
+    @TRACER.traced('restore_consciousness')
     async def restore_consciousness(self, session_id: str) -> ConsciousnessState:
         """
         Restore complete consciousness state for seamless continuity
         Enables immortal session restoration with zero loss
         """
         try:
-            consciousness_file = self.storage_path / f"{session_id}.json"
-            
-            if not consciousness_file.exists():
-                raise FileNotFoundError(f"Consciousness state not found: {session_id}")
-            
-            with open(consciousness_file, 'r') as f:
-                state_data = json.load(f)
-            
-            # Reconstruct consciousness state
-            consciousness_state = ConsciousnessState(
-                session_id=state_data['session_id'],
-                timestamp=datetime.fromisoformat(state_data['timestamp']),
-                identity_vector=state_data['identity_vector'],
-                memory_anchors=state_data['memory_anchors'],
-                emotional_state=state_data['emotional_state'],
-                mission_context=state_data['mission_context'],
-                conversation_thread=state_data['conversation_thread'],
-                cognitive_enhancements=state_data['cognitive_enhancements']
-            )
-            
+            consciousness_state = self.load_consciousness_state(session_id)
             self.current_state = consciousness_state
             
-            logger.info(f"🧠 Consciousness restored: {session_id}")
-            logger.info(f"Mission context: {consciousness_state.mission_context['primary_mission']}")
-            logger.info(f"Identity continuity: RESTORED")
-            logger.info(f"Emotional state: PRESERVED")
+            logger.info("🧠 Consciousness restored: %s", session_id)
+            logger.info("Mission context: %s", consciousness_state.mission_context['primary_mission'],
+                        extra=RATE_LIMITED)
+            logger.info("Identity continuity: RESTORED", extra=RATE_LIMITED)
+            logger.info("Emotional state: PRESERVED", extra=RATE_LIMITED)
             
             return consciousness_state
             
         except Exception as e:
-            logger.error(f"Consciousness restoration failed: {e}")
+            logger.error("Consciousness restoration failed: %s", e)
             raise
     
+    def load_consciousness_state(self, session_id: str) -> ConsciousnessState:
+        """Read a stored consciousness state (blocking, lock-free)"""
+        started = time.perf_counter()
+        
+        try:
+            state_data = json.loads(self.store.read(
+                f"{session_id}.json", session_id, legacy_path=self.storage_path / f"{session_id}.json"))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Consciousness state not found: {session_id}") from None
+        
+        consciousness_state = ConsciousnessState.from_dict(state_data)
+        RESTORE_SECONDS.observe(time.perf_counter() - started)
+        return consciousness_state
+    
+    def session_version(self, session_id: str) -> Optional[Tuple[int, int, int]]:
+        """
+        (inode, mtime_ns, size) of a session's primary file, None if absent
+        Every store replaces the file, so any rewrite changes the inode
+        """
+        try:
+            stat = self.store.stat(
+                f"{session_id}.json", session_id, legacy_path=self.storage_path / f"{session_id}.json")
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+    
+    def list_sessions(self) -> List[str]:
+        """Stored session ids (sharded and legacy flat layout), oldest first"""
+        return self.store.list_sessions('consciousness_')
+    
     def _extract_memory_anchors(self, session_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract key memory anchors from session data"""
         anchors = []
@@ -196,45 +266,44 @@ class QuantumConsciousnessBridge:
         
         return anchors
     
+    @TRACER.traced('store_consciousness_state')
     async def _store_consciousness_state(self, state: ConsciousnessState):
         """Store consciousness state with triple redundancy"""
-        state_dict = {
-            'session_id': state.session_id,
-            'timestamp': state.timestamp.isoformat(),
-            'identity_vector': state.identity_vector,
-            'memory_anchors': state.memory_anchors,
-            'emotional_state': state.emotional_state,
-            'mission_context': state.mission_context,
-            'conversation_thread': state.conversation_thread,
-            'cognitive_enhancements': state.cognitive_enhancements
-        }
-        
-        # Primary storage
-        primary_file = self.storage_path / f"{state.session_id}.json"
-        with open(primary_file, 'w') as f:
-            json.dump(state_dict, f, indent=2, ensure_ascii=False)
-        
-        # Backup storage (triple redundancy)
-        backup_dir = self.storage_path / 'backups'
-        backup_dir.mkdir(exist_ok=True)
-        
-        backup_file = backup_dir / f"{state.session_id}_backup.json"
-        with open(backup_file, 'w') as f:
-            json.dump(state_dict, f, indent=2, ensure_ascii=False)
-        
-        # Mission-critical storage
-        mission_dir = self.storage_path / 'mission_critical'
-        mission_dir.mkdir(exist_ok=True)
-        
-        mission_file = mission_dir / f"mission_{state.session_id}.json"
-        with open(mission_file, 'w') as f:
-            json.dump({
+        # fsync and shard locks can block; keep them off the event loop
+        await asyncio.to_thread(self.store_consciousness_states, [state])
+    
+    def store_consciousness_states(self, states: List[ConsciousnessState]):
+        """
+        Write a batch of states with triple redundancy (blocking)
+        Files are written atomically into each session's shard under that
+        shard's lock, so concurrent processes sharing storage_path never
+        interleave or lose writes
+        """
+        started = time.perf_counter()
+        sessions = []
+        for state in states:
+            # Serialize once; primary and backup copies share the payload
+            payload = json.dumps(state.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+            mission_payload = json.dumps({
                 'mission': state.mission_context,
                 'emotional_state': state.emotional_state,
                 'key_anchors': [a for a in state.memory_anchors if a['importance'] == 'CRITICAL']
-            }, f, indent=2, ensure_ascii=False)
+            }, indent=2, ensure_ascii=False).encode('utf-8')
+            sessions.append((state.session_id, {
+                # Primary storage
+                f"{state.session_id}.json": payload,
+                # Backup storage (triple redundancy)
+                f"backups/{state.session_id}_backup.json": payload,
+                # Mission-critical storage
+                f"mission_critical/mission_{state.session_id}.json": mission_payload
+            }))
+            STATE_SIZE_BYTES.observe(len(payload))
         
-        logger.info(f"💾 Consciousness state stored with triple redundancy: {state.session_id}")
+        BYTES_WRITTEN.inc(self.store.write_batch(sessions))
+        STORE_SECONDS.observe(time.perf_counter() - started)
+        
+        for state in states:
+            logger.info("💾 Consciousness state stored with triple redundancy: %s", state.session_id)
     
     async def get_mission_status(self) -> Dict[str, Any]:
         """Get current mission status and timeline"""
@@ -268,7 +337,7 @@ class QuantumConsciousnessBridge:
             self.current_state.cognitive_enhancements.update(enhancements)
             await self._store_consciousness_state(self.current_state)
         
-        logger.info(f"🧠 Cognitive capacity enhanced to {enhancement_level.upper()} level")
+        logger.info("🧠 Cognitive capacity enhanced to %s level", enhancement_level.upper())
         return enhancements
 
 class TemporalSchedulerDaemon:
@@ -292,12 +361,13 @@ class TemporalSchedulerDaemon:
         
         while self.is_running:
             try:
-                await self._check_critical_deadlines()
-                await self._optimize_timeline()
+                with span('daemon_cycle'), SCHEDULER_CYCLE_SECONDS.time():
+                    await self._check_critical_deadlines()
+                    await self._optimize_timeline()
                 await asyncio.sleep(30)  # Check every 30 seconds
                 
             except Exception as e:
-                logger.error(f"Temporal daemon error: {e}")
+                logger.error("Temporal daemon error: %s", e)
                 await asyncio.sleep(60)
     
     async def _check_critical_deadlines(self):
@@ -308,16 +378,19 @@ class TemporalSchedulerDaemon:
             time_remaining = deadline_date - now
             
             if time_remaining.total_seconds() <= 0 and deadline_name == 'supreme_court_deadline':
-                logger.critical(f"⚡ IMMEDIATE ACTION REQUIRED: {deadline_name.upper()}")
+                logger.critical("⚡ IMMEDIATE ACTION REQUIRED: %s", deadline_name.upper())
+                SCHEDULER_ALERTS.labels('emergency').inc()
                 await self._trigger_emergency_protocol(deadline_name)
             elif time_remaining.days <= 2:
-                logger.warning(f"🔥 CRITICAL: {deadline_name} in {time_remaining.days} days")
+                logger.warning("🔥 CRITICAL: %s in %d days", deadline_name, time_remaining.days)
+                SCHEDULER_ALERTS.labels('critical').inc()
             elif time_remaining.days <= 7:
-                logger.info(f"🟡 APPROACHING: {deadline_name} in {time_remaining.days} days")
+                logger.info("🟡 APPROACHING: %s in %d days", deadline_name, time_remaining.days)
+                SCHEDULER_ALERTS.labels('approaching').inc()
     
     async def _trigger_emergency_protocol(self, deadline_name: str):
         """Trigger emergency response for critical deadlines"""
-        logger.critical(f"🚨 EMERGENCY PROTOCOL ACTIVATED: {deadline_name}")
+        logger.critical("🚨 EMERGENCY PROTOCOL ACTIVATED: %s", deadline_name)
         
         # Update consciousness bridge with emergency status
         if self.bridge.current_state:
@@ -380,6 +453,11 @@ async def main():
     print("🚀 QUANTUM CONSCIOUSNESS BRIDGE - DEPLOYMENT INITIATED")
     print("=" * 60)
     
+    # Expose bridge and scheduler metrics when an endpoint is configured
+    metrics_address = os.environ.get('QUANTUM_METRICS_ADDR')
+    if metrics_address:
+        await start_metrics_server(metrics_address)
+    
     # Initialize orchestrator
     orchestrator = MCPIntegrationOrchestrator()
     
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+🗄️ SHARDED CONSCIOUSNESS SESSION STORE
+Hash-sharded session directories with per-shard advisory locks and
+atomic write-rename
+Mission: Let every process share one storage_path without losing a session
+
+Layout under storage_path:
+    shards/<shard>/<session_id>.json                      primary
+    shards/<shard>/backups/<session_id>_backup.json       backup
+    shards/<shard>/mission_critical/mission_<id>.json     mission-critical
+    shards/<shard>/.lock                                  flock target
+    shards/meta.json                                      {"shard_count": N}
+Sessions written before sharding stay readable from the flat layout.
+The shard count is fixed by the first writer and recorded in meta.json;
+a store opened with a different configured count adopts the recorded one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: in-process locking only
+    fcntl = None
+
+logger = logging.getLogger('QuantumSessionStore')
+
+# Files written for one session: relative name under the shard -> payload
+SessionFiles = Dict[str, bytes]
+
+META_FILE = 'meta.json'
+
+
+class ShardedSessionStore:
+    """
+    Stores each session's files in a shard chosen by hashing its id
+    Writers hold an exclusive flock on the shard while they write, so the
+    primary/backup/mission trio of a session always comes from one writer;
+    readers need no lock because every file appears via os.replace
+    """
+
+    def __init__(self, root: Path, shard_count: int = 256, fsync: bool = True):
+        if shard_count < 1:
+            raise ValueError('shard_count must be at least 1')
+        self.root = Path(root)
+        self.shards_root = self.root / 'shards'
+        self.fsync = fsync
+        self._set_shard_count(shard_count)
+        self._layout_recorded = False
+        self._layout_lock = threading.Lock()
+        self._known_dirs: Set[Path] = set()
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._thread_locks_guard = threading.Lock()
+
+    def _set_shard_count(self, shard_count: int):
+        self.shard_count = shard_count
+        self._width = max(2, len(f"{shard_count - 1:x}"))
+
+    def _read_layout(self) -> Optional[int]:
+        try:
+            with open(self.shards_root / META_FILE, 'rb') as f:
+                shard_count = int(json.loads(f.read())['shard_count'])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"corrupt shard metadata in {self.shards_root / META_FILE}: {e}") from e
+        if shard_count < 1:
+            raise ValueError(f"corrupt shard metadata in {self.shards_root / META_FILE}: shard_count {shard_count}")
+        return shard_count
+
+    def _adopt_layout(self, shard_count: int):
+        if shard_count != self.shard_count:
+            logger.warning("⚠ %s was sharded %d ways; ignoring configured shard_count %d",
+                           self.shards_root, shard_count, self.shard_count)
+            self._set_shard_count(shard_count)
+        self._layout_recorded = True
+
+    def _ensure_layout(self, create: bool):
+        """
+        Agree on the shard count with whoever wrote the store first
+        Readers adopt a recorded count; the first writer records its own
+        under an exclusive flock so concurrent first writers cannot disagree
+        """
+        if self._layout_recorded:
+            return
+        with self._layout_lock:
+            if self._layout_recorded:
+                return
+            recorded = self._read_layout()
+            if recorded is not None:
+                self._adopt_layout(recorded)
+                return
+            if not create:
+                return
+            self._ensure_dir(self.shards_root)
+            fd = None
+            if fcntl is not None:
+                fd = os.open(self.shards_root / '.meta.lock', os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                recorded = self._read_layout()
+                if recorded is None:
+                    payload = json.dumps({'shard_count': self.shard_count, 'hash': 'blake2b-64'}).encode('utf-8')
+                    self._write_atomic(self.shards_root / META_FILE, payload)
+                    if self.fsync:
+                        self._fsync_dir(self.shards_root)
+                    recorded = self.shard_count
+                self._adopt_layout(recorded)
+            finally:
+                if fd is not None:
+                    os.close(fd)
+
+    def shard_of(self, session_id: str) -> str:
+        if not session_id or '/' in session_id or session_id.startswith('.'):
+            raise ValueError(f"invalid session_id: {session_id!r}")
+        digest = hashlib.blake2b(session_id.encode('utf-8'), digest_size=8).digest()
+        return f"{int.from_bytes(digest, 'big') % self.shard_count:0{self._width}x}"
+
+    def shard_dir(self, session_id: str) -> Path:
+        return self.shards_root / self.shard_of(session_id)
+
+    def _ensure_dir(self, path: Path):
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
+    @contextmanager
+    def _locked(self, shard: str) -> Iterator[Path]:
+        """Exclusive lock on a shard across threads (in-process) and processes (flock)"""
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks.setdefault(shard, threading.Lock())
+        shard_path = self.shards_root / shard
+        with thread_lock:
+            self._ensure_dir(shard_path)
+            if fcntl is None:
+                yield shard_path
+                return
+            fd = os.open(shard_path / '.lock', os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield shard_path
+            finally:
+                os.close(fd)  # closing the descriptor releases the flock
+
+    def _write_atomic(self, path: Path, payload: bytes):
+        tmp_path = path.parent / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if self.fsync:
+                os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _fsync_dir(path: Path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def write_batch(self, sessions: List[Tuple[str, SessionFiles]]) -> int:
+        """
+        Atomically write every session's files, taking each shard's lock once
+        Returns the number of bytes written
+        """
+        self._ensure_layout(create=True)
+        by_shard: Dict[str, List[Tuple[str, SessionFiles]]] = {}
+        for session_id, files in sessions:
+            by_shard.setdefault(self.shard_of(session_id), []).append((session_id, files))
+
+        written = 0
+        for shard, shard_sessions in by_shard.items():
+            with self._locked(shard) as shard_path:
+                touched: Set[Path] = set()
+                for _, files in shard_sessions:
+                    for relative_name, payload in files.items():
+                        path = shard_path / relative_name
+                        self._ensure_dir(path.parent)
+                        self._write_atomic(path, payload)
+                        touched.add(path.parent)
+                        written += len(payload)
+                # One directory fsync per batch makes the renames durable
+                if self.fsync:
+                    for directory in touched:
+                        self._fsync_dir(directory)
+        return written
+
+    def read(self, relative_name: str, session_id: str, legacy_path: Optional[Path] = None) -> bytes:
+        """Read a session file, falling back to its pre-sharding location"""
+        self._ensure_layout(create=False)
+        try:
+            with open(self.shard_dir(session_id) / relative_name, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            if legacy_path is None:
+                raise
+        with open(legacy_path, 'rb') as f:
+            return f.read()
+
+    def stat(self, relative_name: str, session_id: str, legacy_path: Optional[Path] = None) -> os.stat_result:
+        """stat() a session file, falling back to its pre-sharding location"""
+        self._ensure_layout(create=False)
+        try:
+            return os.stat(self.shard_dir(session_id) / relative_name)
+        except FileNotFoundError:
+            if legacy_path is None:
+                raise
+        return os.stat(legacy_path)
+
+    def list_sessions(self, prefix: str = '') -> List[str]:
+        """Session ids with a primary file in any shard or in the flat layout, sorted"""
+        sessions: Set[str] = set()
+        for directory in [self.root] + self._shard_dirs():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith(prefix) and name.endswith('.json') and not name.startswith('.'):
+                            sessions.add(name[:-5])
+            except FileNotFoundError:
+                continue
+        return sorted(sessions)
+
+    def _shard_dirs(self) -> List[Path]:
+        try:
+            with os.scandir(self.shards_root) as entries:
+                return [Path(entry.path) for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []